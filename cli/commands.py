@@ -1,64 +1,256 @@
 """
 Command implementations for CLI
 """
-from typing import Dict, Any, List
-import videolib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, NamedTuple, Iterator, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import videolib  # Imported lazily at runtime to keep CLI startup fast
+
+
+class DownloadCommandResult(NamedTuple):
+    """Result of CLICommands.download_video"""
+    success: bool
+    output_file: Optional[str]
+    error: Optional[str]
+    file_size: int
+
+
+class SplitCommandResult(NamedTuple):
+    """Result of CLICommands.split_video"""
+    success: bool
+    output_files: List[str]
+    oversized_files: List[str]
+    error: Optional[str]
+
+
+class ClipsCommandResult(NamedTuple):
+    """Result of CLICommands.create_clips"""
+    success: bool
+    output_files: List[str]
+    failed_clips: List[Any]
+    error: Optional[str]
+
+
+class MediaInfoCommandResult(NamedTuple):
+    """Result of CLICommands.get_media_info"""
+    success: bool
+    error: Optional[str] = None
+    duration: float = 0.0
+    video_codec: Optional[str] = None
+    audio_codec: Optional[str] = None
+    format: Optional[str] = None
+    size_bytes: int = 0
+    width: int = 0
+    height: int = 0
+    bitrate: Optional[int] = None
+
+
+# ffprobe results keyed by (path, mtime_ns, size); a changed file gets a new key
+MEDIA_INFO_CACHE_SIZE = 256
+_media_info_cache = OrderedDict()
+
+
+def cached_media_info(processor, file_path: str):
+    """Get media info through the processor, reusing earlier results for unchanged files"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return processor.get_media_info(file_path)
+
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    if key in _media_info_cache:
+        _media_info_cache.move_to_end(key)
+        return _media_info_cache[key]
+
+    media_info = processor.get_media_info(file_path)
+    if media_info:
+        _media_info_cache[key] = media_info
+        if len(_media_info_cache) > MEDIA_INFO_CACHE_SIZE:
+            _media_info_cache.popitem(last=False)
+    return media_info
+
+
+def prune_cache_dir(cache_dir: str, keep: int, prefix: str = "", suffix: str = "") -> None:
+    """Delete all but the `keep` most recently used prefix*suffix files in cache_dir"""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [e for e in it
+                       if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass  # In use by another run or already gone
+
+
+def _run_single_task(processor_kwargs: Dict[str, Any], task: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one batch task in a worker process with its own processor"""
+    try:
+        import videolib
+        processor = videolib.create_processor(**processor_kwargs)
+        return processor.process_batch([task])
+    except Exception as e:
+        return {
+            'total_tasks': 1,
+            'successful_tasks': 0,
+            'failed_tasks': 1,
+            'results': [{
+                'task_index': 0,
+                'task_type': task.get('type'),
+                'result': {'success': False, 'error': str(e)}
+            }]
+        }
+
+
+def _task_reads_files(task: Dict[str, Any]) -> bool:
+    """Whether a batch task consumes existing files (which earlier tasks may still be producing)"""
+    parameters = task.get('parameters') or {}
+    return bool(parameters.get('source_file') or parameters.get('source_files'))
+
+
+def task_succeeded(task_result: Dict[str, Any]) -> bool:
+    """Success flag of one batch result entry (result may be a dict or a result object)"""
+    result = task_result.get('result')
+    if isinstance(result, dict):
+        return bool(result.get('success', False))
+    return bool(getattr(result, 'success', False))
+
 
 class CLICommands:
     """CLI command implementations"""
     
-    def __init__(self, processor: videolib.VideoProcessor):
+    def __init__(self, processor: "videolib.VideoProcessor"):
         self.processor = processor
     
-    def download_video(self, url: str, output_path: str, **kwargs) -> Dict[str, Any]:
+    def download_video(self, url: str, output_path: str, **kwargs) -> DownloadCommandResult:
         """Download video command"""
         result = self.processor.download_video(url, output_path, **kwargs)
-        return {
-            'success': result.success,
-            'output_file': result.output_file,
-            'error': result.error_message,
-            'file_size': result.file_size
-        }
+        return DownloadCommandResult(
+            success=result.success,
+            output_file=result.output_file,
+            error=result.error_message,
+            file_size=result.file_size
+        )
     
-    def split_video(self, source_file: str, output_name: str, max_size: str, **kwargs) -> Dict[str, Any]:
+    def split_video(self, source_file: str, output_name: str, max_size: str, **kwargs) -> SplitCommandResult:
         """Split video command"""
         result = self.processor.split_video_by_size(source_file, output_name, max_size, **kwargs)
-        return {
-            'success': result.success,
-            'output_files': result.output_files,
-            'oversized_files': result.oversized_files,
-            'error': result.error_message
-        }
+        return SplitCommandResult(
+            success=result.success,
+            output_files=result.output_files,
+            oversized_files=result.oversized_files,
+            error=result.error_message
+        )
     
-    def create_clips(self, source_file: str, output_name: str, intervals: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+    def create_clips(self, source_file: str, output_name: str, intervals: List[Dict[str, Any]], **kwargs) -> ClipsCommandResult:
         """Create clips command"""
         result = self.processor.create_clips(source_file, output_name, intervals, **kwargs)
+        return ClipsCommandResult(
+            success=result.success,
+            output_files=result.output_files,
+            failed_clips=result.failed_clips,
+            error=result.error_message
+        )
+    
+    def process_batch(self, tasks: List[Dict[str, Any]], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Process batch command, running independent tasks in parallel worker processes"""
+        if self._batch_workers(tasks, max_workers) <= 1:
+            return self.processor.process_batch(tasks)
+
+        results = sorted(self.process_batch_stream(tasks, max_workers), key=lambda r: r['task_index'])
+        successful = sum(1 for task_result in results if task_succeeded(task_result))
         return {
-            'success': result.success,
-            'output_files': result.output_files,
-            'failed_clips': result.failed_clips,
-            'error': result.error_message
+            'total_tasks': len(tasks),
+            'successful_tasks': successful,
+            'failed_tasks': len(tasks) - successful,
+            'success_rate': successful / len(tasks) * 100,
+            'results': results
         }
+
+    def process_batch_stream(self, tasks: List[Dict[str, Any]],
+                             max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield per-task results as tasks finish.
+
+        Each result carries its task_index, since completion order is not
+        task order. At most two tasks per worker are in flight, so memory
+        stays flat however long the task list is.
+
+        Tasks are started in their "order". Only tasks that read no files
+        (downloads) overlap each other; a task with a source file waits for
+        every earlier task to finish and runs alone, so it never sees a
+        half-written input.
+        """
+        max_workers = self._batch_workers(tasks, max_workers)
+        if max_workers <= 1:
+            for task_index, task in self._ordered_tasks(tasks):
+                for task_result in self.processor.process_batch([task]).get('results', []):
+                    yield dict(task_result, task_index=task_index)
+            return
+
+        processor_kwargs = self._processor_kwargs()
+        pending = {}  # future -> (task_index, reads_files)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for task_index, task in self._ordered_tasks(tasks):
+                reads_files = _task_reads_files(task)
+                exclusive = reads_files or any(reads for _, reads in pending.values())
+                while pending and (exclusive or len(pending) >= max_workers * 2):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        done_index, _ = pending.pop(future)
+                        for task_result in future.result().get('results', []):
+                            yield dict(task_result, task_index=done_index)
+                pending[pool.submit(_run_single_task, processor_kwargs, task)] = (task_index, reads_files)
+
+            for future in as_completed(pending):
+                done_index, _ = pending[future]
+                for task_result in future.result().get('results', []):
+                    yield dict(task_result, task_index=done_index)
+
+    @staticmethod
+    def _ordered_tasks(tasks: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """(task_index, task) pairs sorted by the tasks' "order" field (list position if missing)"""
+        return sorted(enumerate(tasks), key=lambda item: item[1].get('order', item[0]))
+
+    @staticmethod
+    def _batch_workers(tasks: List[Dict[str, Any]], max_workers: Optional[int]) -> int:
+        """Worker process count for a batch (default: half the CPU cores)"""
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        return min(max_workers, len(tasks))
+
+    def _processor_kwargs(self) -> Dict[str, Any]:
+        """FFmpeg/FFprobe paths needed to recreate this processor in a worker process"""
+        kwargs = {}
+        ffmpeg_path = getattr(getattr(self.processor, 'ffmpeg', None), 'ffmpeg_path', None)
+        if ffmpeg_path:
+            kwargs['ffmpeg_path'] = ffmpeg_path
+        ffprobe_path = getattr(getattr(self.processor, 'ffprobe', None), 'ffprobe_path', None)
+        if ffprobe_path:
+            kwargs['ffprobe_path'] = ffprobe_path
+        return kwargs
     
-    def process_batch(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Process batch command"""
-        return self.processor.process_batch(tasks)
-    
-    def get_media_info(self, file_path: str) -> Dict[str, Any]:
+    def get_media_info(self, file_path: str) -> MediaInfoCommandResult:
         """Get media info command"""
-        media_info = self.processor.get_media_info(file_path)
+        media_info = cached_media_info(self.processor, file_path)
         
         if not media_info:
-            return {'success': False, 'error': 'Could not get media information'}
+            return MediaInfoCommandResult(success=False, error='Could not get media information')
         
-        return {
-            'success': True,
-            'duration': media_info.duration,
-            'video_codec': media_info.video_codec,
-            'audio_codec': media_info.audio_codec,
-            'format': media_info.format_name,
-            'size_bytes': media_info.size_bytes,
-            'width': media_info.width,
-            'height': media_info.height,
-            'bitrate': media_info.bitrate
-        }
+        return MediaInfoCommandResult(
+            success=True,
+            duration=media_info.duration,
+            video_codec=media_info.video_codec,
+            audio_codec=media_info.audio_codec,
+            format=media_info.format_name,
+            size_bytes=media_info.size_bytes,
+            width=media_info.width,
+            height=media_info.height,
+            bitrate=media_info.bitrate
+        )
@@ -1,18 +1,335 @@
+import hashlib
+import io
 import os
+import re
+import struct
+import sys
 import time
-from typing import List, Tuple, Optional
-
-from videolib import VideoProcessor, create_gif_clips
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Tuple, Optional, Callable
+
+try:
+    import readline  # Not available on Windows
+except ImportError:
+    readline = None
+
+from .commands import cached_media_info, prune_cache_dir
 from .ui import UIHelper, Colors, ProgressReporter
 
 
+# Palette size per quality level for the CLI-side batched GIF renderer
+GIF_QUALITY_COLORS = {"low": 64, "medium": 128, "high": 256}
+
+# paletteuse options per dither setting; ordered Bayer is per-pixel and threads well
+GIF_DITHER_OPTIONS = {
+    "bayer": "dither=bayer:bayer_scale=5",
+    "floyd_steinberg": "dither=floyd_steinberg",
+    "none": "dither=none",
+}
+
+# Read size for FFmpeg progress pipes
+PIPE_READ_SIZE = 65536
+
+# Plain whole-number prompt input, parsed without try/except (see GifCommands._prompt_numeric)
+_INT_INPUT_RE = re.compile(r"^\d{1,6}$")
+
+# Most GIF outputs fused into one FFmpeg filtergraph
+MAX_OUTPUTS_PER_PROCESS = 16
+
+# Segments closer than this (seconds) share one decode range; wider gaps are seeked over
+MERGE_GAP = 2.0
+
+# Longest span (seconds) a single FFmpeg process decodes through
+MAX_DECODE_RANGE = 120.0
+
+# Shared palettes are kept here between runs (see shared_palette_path); only the
+# most recently used PALETTE_CACHE_MAX files are kept
+PALETTE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "videolib_gif_palettes")
+PALETTE_CACHE_MAX = 32
+
+
+@dataclass
+class GifClipsResult:
+    """Result of a batched GIF render (mirrors the processor's GIF result fields)"""
+    success: bool
+    gif_files: List[str] = field(default_factory=list)
+    thumbnail_files: List[str] = field(default_factory=list)
+    total_duration: float = 0.0
+    processing_time: float = 0.0
+    error_message: Optional[str] = None
+    media_info: Optional[dict] = None
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_has_cuda(ffmpeg_path: str) -> bool:
+    """Check once per FFmpeg binary whether it lists the CUDA hwaccel"""
+    try:
+        output = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-hwaccels"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "cuda" in output.split()
+
+
+def _scale_filters(fps: int, scale_width: int, hwaccel: bool) -> str:
+    """fps + scale filter chain; with hwaccel, scale on the GPU and download the frames"""
+    if hwaccel:
+        return f"fps={fps},scale_cuda={scale_width}:-2,hwdownload,format=nv12"
+    return f"fps={fps},scale={scale_width}:-1:flags=lanczos"
+
+
+def _input_args(source_file: str, hwaccel: bool) -> List[str]:
+    """Source input args, decoding on the GPU with hwaccel"""
+    if hwaccel:
+        return ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda", "-i", source_file]
+    return ["-i", source_file]
+
+
+def shared_palette_path(source_file: str, segments: List[Tuple[float, float]],
+                        fps: int, scale_width: int, max_colors: int,
+                        hwaccel: bool = False) -> str:
+    """
+    Cache path for the shared palette of a render request.
+
+    The key covers the source identity (path, mtime, size), the sampled
+    segments and the settings that change the palette, including the
+    decode path (CUDA scaling differs from lanczos), so an edited source
+    or different settings never reuse a stale palette.
+    """
+    st = os.stat(source_file)
+    key = repr((os.path.abspath(source_file), st.st_mtime_ns, st.st_size,
+                [(round(start, 3), round(duration, 3)) for start, duration in segments],
+                fps, scale_width, max_colors, hwaccel))
+    os.makedirs(PALETTE_CACHE_DIR, exist_ok=True)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(PALETTE_CACHE_DIR, f"palette_{digest}.png")
+
+
+def prune_palette_cache(keep: int = PALETTE_CACHE_MAX) -> None:
+    """Delete all but the `keep` most recently used palettes in PALETTE_CACHE_DIR"""
+    prune_cache_dir(PALETTE_CACHE_DIR, keep, prefix="palette_")
+
+
+def read_gif_screen(gif_file: str) -> Optional[Tuple[int, int, bytes]]:
+    """Logical screen size and global color table of a GIF file (None if unreadable)"""
+    try:
+        with open(gif_file, "rb") as f:
+            header = f.read(13)
+            if len(header) < 13 or not header.startswith(b"GIF"):
+                return None
+            width, height, packed = struct.unpack("<HHB", header[6:11])
+            color_table = f.read(3 << ((packed & 0x07) + 1)) if packed & 0x80 else b""
+    except OSError:
+        return None
+    return width, height, color_table
+
+
+def gifs_stream_copyable(gif_files: List[str], final_width: int, final_height: Optional[int]) -> bool:
+    """
+    Whether concatenating gif_files with -c copy already gives the final GIF.
+
+    The clips must share one screen size and global palette (the GIF muxer
+    keeps only the first file's palette), and that size must be what the
+    merge scale would produce for the final resolution.
+    """
+    screens = {read_gif_screen(gif_file) for gif_file in gif_files}
+    if None in screens or len(screens) != 1:
+        return False
+    width, height, _ = screens.pop()
+    if not final_height:
+        return width == final_width
+    # force_original_aspect_ratio=decrease leaves a clip that touches the box unchanged
+    return (width <= final_width and height <= final_height
+            and (width == final_width or height == final_height))
+
+
+def _decode_range_args(segments: List[Tuple[float, float]]) -> Tuple[float, List[str]]:
+    """Input seek/limit args covering all segments, plus the seek offset they introduce"""
+    decode_start = min(start for start, _ in segments)
+    decode_end = max(start + duration for start, duration in segments)
+    return decode_start, [
+        "-ss", f"{decode_start:.3f}",
+        "-t", f"{decode_end - decode_start:.3f}",  # Stop decoding after the last segment
+    ]
+
+
+def build_palette_command(ffmpeg_path: str, source_file: str,
+                          segments: List[Tuple[float, float]], palette_file: str,
+                          fps: int, scale_width: int, max_colors: int = 256,
+                          threads: int = 1, hwaccel: bool = False) -> List[str]:
+    """
+    Build an FFmpeg command that generates one palette for a set of segments.
+
+    Only frames inside the segments are sampled, at the same fps and scale
+    the GIFs are rendered with.
+
+    Args:
+        ffmpeg_path: FFmpeg executable
+        source_file: Source video path
+        segments: List of (start, duration) tuples in seconds
+        palette_file: Output palette image path
+        fps: Output frame rate
+        scale_width: Output width in pixels
+        max_colors: Palette size
+        threads: FFmpeg decoder/filter thread count
+        hwaccel: Decode and scale with CUDA
+
+    Returns:
+        FFmpeg argv list
+    """
+    decode_start, range_args = _decode_range_args(segments)
+    selected = "+".join(
+        f"between(t,{start - decode_start:.3f},{start - decode_start + duration:.3f})"
+        for start, duration in segments
+    )
+
+    return [
+        ffmpeg_path, "-y", "-hide_banner",
+        "-loglevel", "error", "-nostats",
+        "-progress", "pipe:1",
+        "-threads", str(threads),
+        *range_args,
+        *_input_args(source_file, hwaccel),
+        "-vf", f"select='{selected}',{_scale_filters(fps, scale_width, hwaccel)},"
+               f"palettegen=max_colors={max_colors}",
+        "-frames:v", "1",
+        palette_file,
+    ]
+
+
+def build_batched_gif_command(ffmpeg_path: str, source_file: str,
+                              segments: List[Tuple[float, float]], output_files: List[str],
+                              fps: int, scale_width: int, max_colors: int = 256,
+                              threads: int = 1, palette_file: Optional[str] = None,
+                              hwaccel: bool = False, dither: str = "bayer") -> List[str]:
+    """
+    Build a single FFmpeg command that renders every segment to its own GIF.
+
+    The source is seeked to the first segment and decoded once; a split
+    filter fans the decoded frames out to one trim -> fps -> scale -> palette
+    chain per segment. With palette_file, every segment is mapped through that
+    shared palette; otherwise each segment generates its own.
+
+    Args:
+        ffmpeg_path: FFmpeg executable
+        source_file: Source video path
+        segments: List of (start, duration) tuples in seconds
+        output_files: One output GIF path per segment
+        fps: Output frame rate
+        scale_width: Output width in pixels (height keeps aspect ratio)
+        max_colors: Palette size per GIF (ignored with palette_file)
+        threads: FFmpeg decoder/filter thread count
+        palette_file: Optional palette image from build_palette_command
+        hwaccel: Decode and scale with CUDA (palette mapping stays on the CPU)
+        dither: Key of GIF_DITHER_OPTIONS
+
+    Returns:
+        FFmpeg argv list
+    """
+    count = len(segments)
+    decode_start, range_args = _decode_range_args(segments)
+
+    def labels(prefix):
+        return "".join(f"[{prefix}{i}]" for i in range(count))
+
+    chains = [f"[0:v]split={count}{labels('v')}"]
+    if palette_file:
+        chains.append(f"[1:v]split={count}{labels('p')}")
+    for i, (start, duration) in enumerate(segments):
+        chain = (
+            f"[v{i}]trim=start={start - decode_start:.3f}:duration={duration:.3f},setpts=PTS-STARTPTS,"
+            f"{_scale_filters(fps, scale_width, hwaccel)}"
+        )
+        if palette_file:
+            chains.append(f"{chain}[b{i}]")
+        else:
+            chains.append(f"{chain},split[a{i}][b{i}]")
+            chains.append(f"[a{i}]palettegen=max_colors={max_colors}[p{i}]")
+        chains.append(f"[b{i}][p{i}]paletteuse={GIF_DITHER_OPTIONS[dither]}[o{i}]")
+
+    cmd = [
+        ffmpeg_path, "-y", "-hide_banner",
+        "-loglevel", "error", "-nostats",
+        "-progress", "pipe:1",
+        "-threads", str(threads),
+        *range_args,
+        *_input_args(source_file, hwaccel),
+    ]
+    if palette_file:
+        cmd += ["-i", palette_file]
+    cmd += [
+        "-filter_complex_threads", str(threads),
+        "-filter_complex", ";".join(chains),
+    ]
+    for i, output_file in enumerate(output_files):
+        cmd += ["-map", f"[o{i}]", output_file]
+    return cmd
+
+
+def plan_decode_batches(segments: List[Tuple[float, float]], output_files: List[str],
+                        workers: int) -> List[Tuple[List[Tuple[float, float]], List[str]]]:
+    """
+    Group segments into decode batches, one FFmpeg process each.
+
+    Segments are taken in start-time order and split into `workers` groups of
+    neighbours. Inside a group, a new batch starts whenever the next segment
+    is MERGE_GAP or more past the current decode range. It also starts when
+    the range would exceed MAX_DECODE_RANGE seconds or the batch already has
+    MAX_OUTPUTS_PER_PROCESS outputs. Each process therefore decodes only
+    nearby frames, once, and seeks over large gaps.
+
+    Returns:
+        List of (segments, output_files) per batch
+    """
+    order = sorted(range(len(segments)), key=lambda i: segments[i][0])
+    group_size = -(-len(order) // workers)
+
+    batches = []
+    for group_start in range(0, len(order), group_size):
+        current = []
+        range_start = range_end = 0.0
+        for i in order[group_start:group_start + group_size]:
+            start, duration = segments[i]
+            if current and (start - range_end >= MERGE_GAP
+                            or start + duration - range_start > MAX_DECODE_RANGE
+                            or len(current) >= MAX_OUTPUTS_PER_PROCESS):
+                batches.append(current)
+                current = []
+            if not current:
+                range_start = range_end = start
+            current.append(i)
+            range_end = max(range_end, start + duration)
+        if current:
+            batches.append(current)
+
+    return [([segments[i] for i in batch], [output_files[i] for i in batch]) for batch in batches]
+
+
+def _safe_size(path: str) -> int:
+    """File size in bytes from a single stat call, 0 if the file is missing"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
 class GifCommands:
     """Enhanced GIF conversion commands for CLI interface"""
 
     def __init__(self):
+        from videolib import VideoProcessor  # Deferred so importing the CLI stays cheap
         self.processor = VideoProcessor()
         self.ui = UIHelper()
         self.progress = ProgressReporter()
+        self._completion_matches = []
 
     def create_gif_clips_interactive(self):
         """Interactive GIF creation workflow"""
@@ -26,7 +343,7 @@ class GifCommands:
 
             # Get video info
             self.ui.print_info("Analyzing video file...")
-            media_info = self.processor.get_media_info(source_file)
+            media_info = cached_media_info(self.processor, source_file)
             if not media_info:
                 self.ui.print_error("Could not analyze video file")
                 return
@@ -51,27 +368,66 @@ class GifCommands:
         self.ui.print_step("Step 1: Source Video")
 
         while True:
-            source_file = self.ui.get_input("Enter source video file path")
+            with self._path_completion():
+                source_file = self.ui.get_input("Enter source video file path")
 
             if not source_file:
                 continue
 
-            if not os.path.exists(source_file):
+            if not os.path.isfile(source_file):
                 self.ui.print_error("File not found. Please try again.")
                 continue
 
             return source_file
 
+    @contextmanager
+    def _path_completion(self):
+        """Tab-complete file paths for prompts inside the block, then restore readline's setup"""
+        if not readline:
+            yield
+            return
+
+        previous_completer = readline.get_completer()
+        previous_delims = readline.get_completer_delims()
+        readline.set_completer(self._path_completer)
+        readline.set_completer_delims(" \t\n;")
+        readline.parse_and_bind("tab: complete")
+        try:
+            yield
+        finally:
+            readline.set_completer(previous_completer)
+            readline.set_completer_delims(previous_delims)
+            if previous_completer is None:
+                readline.parse_and_bind("tab: tab-insert")  # Python's default without a completer
+
+    def _path_completer(self, text: str, state: int) -> Optional[str]:
+        """readline completer for file paths; matches are computed once per completion"""
+        if state == 0:
+            directory, prefix = os.path.split(text)
+            try:
+                with os.scandir(os.path.expanduser(directory) or ".") as entries:
+                    self._completion_matches = sorted(
+                        os.path.join(directory, entry.name) + (os.sep if entry.is_dir() else "")
+                        for entry in entries if entry.name.startswith(prefix)
+                    )
+            except OSError:
+                self._completion_matches = []
+
+        if state < len(self._completion_matches):
+            return self._completion_matches[state]
+        return None
+
     def _display_video_info(self, media_info):
         """Display video information"""
         duration_str = self.ui.format_duration(media_info.duration)
         size_str = self.ui.format_file_size(media_info.size_bytes)
 
-        print(f"-> Duration: {Colors.colorize(duration_str, Colors.GREEN)}")
-        print(f"-> Size: {Colors.colorize(size_str, Colors.GREEN)}")
-        print(f"-> Video codec: {Colors.colorize(media_info.video_codec, Colors.CYAN)}")
-        print(f"-> Audio codec: {Colors.colorize(media_info.audio_codec, Colors.CYAN)}")
-        print()
+        sys.stdout.write(
+            f"-> Duration: {Colors.colorize(duration_str, Colors.GREEN)}\n"
+            f"-> Size: {Colors.colorize(size_str, Colors.GREEN)}\n"
+            f"-> Video codec: {Colors.colorize(media_info.video_codec, Colors.CYAN)}\n"
+            f"-> Audio codec: {Colors.colorize(media_info.audio_codec, Colors.CYAN)}\n\n"
+        )
 
     def _choose_gif_method(self) -> str:
         """Choose GIF creation method"""
@@ -92,37 +448,20 @@ class GifCommands:
         self.ui.print_step("Step 3: Enhanced Auto-Generate Settings")
 
         # Get number of clips
-        while True:
-            try:
-                num_clips_input = self.ui.get_input("Number of GIF clips to create")
-                num_clips = int(num_clips_input)
-                if num_clips > 0:
-                    break
-                self.ui.print_error("Please enter a positive number")
-            except ValueError:
-                self.ui.print_error("Please enter a valid number")
+        num_clips = self._prompt_numeric(
+            "Number of GIF clips to create", None, int, 1, None, "Please enter a positive number"
+        )
 
         # Get GIF duration (length of each clip)
-        while True:
-            try:
-                gif_duration_input = self.ui.get_input("Duration of each GIF clip (seconds)")
-                gif_duration = float(gif_duration_input)
-                if gif_duration > 0:
-                    break
-                self.ui.print_error("Duration must be greater than 0")
-            except ValueError:
-                self.ui.print_error("Please enter a valid number")
+        gif_duration = self._prompt_numeric(
+            "Duration of each GIF clip (seconds)", None, float, 0, None,
+            "Duration must be greater than 0", lo_exclusive=True
+        )
 
         # Get time gap between clips
-        while True:
-            try:
-                time_gap_input = self.ui.get_input("Time gap between clips (seconds)", "0")
-                time_gap = float(time_gap_input)
-                if time_gap >= 0:
-                    break
-                self.ui.print_error("Time gap must be 0 or greater")
-            except ValueError:
-                self.ui.print_error("Please enter a valid number")
+        time_gap = self._prompt_numeric(
+            "Time gap between clips (seconds)", "0", float, 0, None, "Time gap must be 0 or greater"
+        )
 
         # Calculate total time needed and show warning if necessary
         total_time_needed = (num_clips * gif_duration) + ((num_clips - 1) * time_gap)
@@ -143,14 +482,13 @@ class GifCommands:
         final_gif_width, final_gif_height = self._get_final_gif_resolution_setting(source_file)
 
         # Enhanced options
-        create_thumbnails = self.ui.confirm_action("Create thumbnail images?", default=True)
-        create_grid = self.ui.confirm_action("Create thumbnail grid with media info?", default=True)
         merge_gifs = self.ui.confirm_action("Merge all GIFs into one file?", default=True)
 
-        # Additional enhanced option: cleanup individual thumbnails
+        # Thumbnails, optional grid and cleanup of individual thumbnails
         create_thumbnails = self.ui.confirm_action("Create thumbnails from video clips?", default=True)
         create_grid = False
         cleanup_individual_thumbs = False
+        grid_thumb_width = grid_thumb_height = grid_max_width = grid_max_height = None
         
         if create_thumbnails:
             create_grid = self.ui.confirm_action("Create thumbnail grid with media info?", default=True)
@@ -172,6 +510,16 @@ class GifCommands:
                     default=False
                 )
 
+        # Dither only reaches the CLI's batched renderer and merge, threads and
+        # jobs only the renderer; the processor's paths take none of them
+        batched = not create_thumbnails and not merge_gifs
+        dither = threads = jobs = None
+        if not create_thumbnails:
+            dither = self._get_dither_setting()
+        if batched:
+            threads = self._get_threads_setting()
+            jobs = self._get_jobs_setting(threads)
+
         # Confirmation
         self.ui.print_step("Step 4: Confirmation")
         print(f"-> Source: {Colors.colorize(source_file, Colors.YELLOW)}")
@@ -184,6 +532,12 @@ class GifCommands:
         print(f"-> FPS: {Colors.colorize(str(fps), Colors.BLUE)}")
         print(f"-> Scale width: {Colors.colorize(f'{scale_width}px', Colors.BLUE)}")
         print(f"-> Quality: {Colors.colorize(quality_level, Colors.BLUE)}")
+        if not create_thumbnails:
+            print(f"-> Dither: {Colors.colorize(dither, Colors.BLUE)}")
+        if batched:
+            print(f"-> FFmpeg threads: {Colors.colorize(str(threads), Colors.BLUE)}")
+            print(f"-> Decoder: {Colors.colorize(self._decoder_label(), Colors.BLUE)}")
+            print(f"-> Parallel FFmpeg jobs: {Colors.colorize(str(jobs), Colors.BLUE)}")
         print(f"-> Create thumbnails: {Colors.colorize('Yes' if create_thumbnails else 'No', Colors.MAGENTA)}")
         print(f"-> Create grid: {Colors.colorize('Yes' if create_grid else 'No', Colors.MAGENTA)}")
         print(f"-> Merge GIFs: {Colors.colorize('Yes' if merge_gifs else 'No', Colors.MAGENTA)}")
@@ -193,24 +547,24 @@ class GifCommands:
 
         # cleanup option to confirmation display
         if create_grid:
-            print(f"-> Create grid: {Colors.colorize('Yes' if create_grid else 'No', Colors.MAGENTA)}")
             if cleanup_individual_thumbs:
                 print(f"-> Cleanup individual thumbs: {Colors.colorize('Yes (keep grid only)', Colors.YELLOW)}")
             else:
                 print(f"-> Cleanup individual thumbs: {Colors.colorize('No (keep all)', Colors.GREEN)}")
 
         # Show timeline preview
-        print(f"\n-> Timeline Preview:")
-        for i in range(min(num_clips, 5)):  # Show first 5 clips
-            start_time = i * (gif_duration + time_gap)
-            end_time = start_time + gif_duration
-            start_str = self.ui.format_duration(start_time)
-            end_str = self.ui.format_duration(end_time)
-            print(f"   Clip {i+1}: {Colors.colorize(f'{start_str} - {end_str}', Colors.CYAN)}")
-
+        step = gif_duration + time_gap
+        segments = [(i * step, gif_duration) for i in range(num_clips)]
+        format_duration = self.ui.format_duration
+        preview = ["\n-> Timeline Preview:"]
+        preview += [  # Show first 5 clips
+            f"   Clip {i}: "
+            f"{Colors.colorize(f'{format_duration(start)} - {format_duration(start + duration)}', Colors.CYAN)}"
+            for i, (start, duration) in enumerate(segments[:5], 1)
+        ]
         if num_clips > 5:
-            print(f"   ... and {num_clips - 5} more clips")
-        print()
+            preview.append(f"   ... and {num_clips - 5} more clips")
+        sys.stdout.write("\n".join(preview) + "\n\n")
 
         if not self.ui.confirm_action("Proceed with enhanced GIF creation?"):
             return
@@ -223,26 +577,47 @@ class GifCommands:
         self.progress.start(num_clips + 2, "Creating GIF clips with enhancements...")
 
         try:
-            result = self.processor.create_auto_gif_clips(
-                source_file=source_file,
-                num_clips=num_clips,
-                gif_duration=gif_duration,
-                time_gap=time_gap,
-                output_name=output_name,
-                fps=fps,
-                scale_width=scale_width,
-                quality_level=quality_level,
-                create_thumbnails=create_thumbnails,
-                create_grid=create_grid,
-                merge_gifs=merge_gifs,
-                cleanup_individual_thumbs=cleanup_individual_thumbs,
-                final_gif_width=final_gif_width,    
-                final_gif_height=final_gif_height,
-                grid_thumb_width=grid_thumb_width,    
-                grid_thumb_height=grid_thumb_height, 
-                grid_max_width=grid_max_width,         
-                grid_max_height=grid_max_height 
-            )
+            if batched:
+                # Plain clips: render all segments in batched FFmpeg passes
+                result = self._create_gif_clips_batched(
+                    source_file, segments, output_name, fps, scale_width,
+                    quality_level, total_duration, threads, jobs=jobs, dither=dither
+                )
+            else:
+                # The processor renders (and names) the clips; a plain merge is
+                # done here so matching clips can be stream-copied
+                cli_merge = merge_gifs and not create_thumbnails
+                result = self.processor.create_auto_gif_clips(
+                    source_file=source_file,
+                    num_clips=num_clips,
+                    gif_duration=gif_duration,
+                    time_gap=time_gap,
+                    output_name=output_name,
+                    fps=fps,
+                    scale_width=scale_width,
+                    quality_level=quality_level,
+                    create_thumbnails=create_thumbnails,
+                    create_grid=create_grid,
+                    merge_gifs=merge_gifs and not cli_merge,
+                    cleanup_individual_thumbs=cleanup_individual_thumbs,
+                    final_gif_width=final_gif_width,    
+                    final_gif_height=final_gif_height,
+                    grid_thumb_width=grid_thumb_width,    
+                    grid_thumb_height=grid_thumb_height, 
+                    grid_max_width=grid_max_width,         
+                    grid_max_height=grid_max_height 
+                )
+                if cli_merge and result.success:
+                    merged_file = f"{output_name}_merged.gif"
+                    error = self._merge_gif_files(
+                        result.gif_files, merged_file,
+                        final_gif_width, final_gif_height, quality_level, dither
+                    )
+                    if error:
+                        result.success = False
+                        result.error_message = f"Merging GIFs failed: {error}"
+                    else:
+                        result.gif_files.append(merged_file)
 
             self.progress.finish("GIF creation completed!")
             self._display_enhanced_gif_results(result)
@@ -251,6 +626,224 @@ class GifCommands:
             self.progress.finish("GIF creation failed!")
             self.ui.print_error(f"Error during GIF creation: {e}")
 
+    def _create_gif_clips_batched(self, source_file: str, segments: List[Tuple[float, float]],
+                                  output_name: str, fps: int, scale_width: int,
+                                  quality_level: str = "medium",
+                                  total_duration: Optional[float] = None,
+                                  threads: int = 1, shared_palette: bool = True,
+                                  jobs: Optional[int] = None, dither: str = "bayer") -> GifClipsResult:
+        """
+        Render (start, duration) segments to GIFs with batched FFmpeg invocations.
+
+        Segments are split into up to `jobs` (default: `threads`) contiguous
+        groups; each group is one FFmpeg process, the processes run
+        concurrently and share the `threads` budget between them. With
+        shared_palette, one palette is generated up front for all segments and
+        every clip is mapped through it instead of running its own palettegen.
+        Decode and scale run on CUDA when FFmpeg offers it, falling back to
+        the CPU if the accelerated run fails.
+        """
+        started = time.time()
+
+        # Drop segments past the end of the video and clamp the last one
+        if total_duration:
+            segments = [(start, min(duration, total_duration - start))
+                        for start, duration in segments if start < total_duration]
+        if not segments:
+            return GifClipsResult(success=False, error_message="No clips fall within the video duration")
+
+        output_files = [f"{output_name}_{i:03d}.gif" for i in range(1, len(segments) + 1)]
+        ffmpeg_path = self.processor.ffmpeg.ffmpeg_path
+        max_colors = GIF_QUALITY_COLORS.get(quality_level, 256)
+
+        workers = max(1, min(jobs or threads, len(segments)))
+        batches = plan_decode_batches(segments, output_files, workers)
+        workers = min(workers, len(batches))
+        process_threads = max(1, threads // workers)
+
+        render_args = (source_file, segments, batches, fps, scale_width, max_colors,
+                       threads, process_threads, workers, shared_palette, dither)
+        hwaccel = self._gpu_decode_available()
+        errors = self._render_gif_batches(*render_args, hwaccel=hwaccel)
+        if errors and hwaccel:
+            self.ui.print_warning("CUDA decoding failed, retrying on CPU...")
+            errors = self._render_gif_batches(*render_args, hwaccel=False)
+
+        processing_time = time.time() - started
+
+        if errors:
+            return GifClipsResult(
+                success=False,
+                processing_time=processing_time,
+                error_message="\n".join(errors)
+            )
+
+        return GifClipsResult(
+            success=True,
+            gif_files=[f for f in output_files if os.path.exists(f)],
+            total_duration=sum(duration for _, duration in segments),
+            processing_time=processing_time
+        )
+
+    def _merge_gif_files(self, gif_files: List[str], merged_file: str,
+                         final_width: int, final_height: int,
+                         quality_level: str = "medium", dither: str = "bayer") -> Optional[str]:
+        """
+        Merge GIF clips into one file with the FFmpeg concat demuxer.
+
+        Clips that share one size and palette matching the final resolution
+        are stream-copied (see gifs_stream_copyable); otherwise the joined
+        stream is rescaled and re-paletted in a single pass.
+
+        Returns:
+            Error message, or None on success
+        """
+        with tempfile.TemporaryDirectory(prefix="videolib_gif_") as temp_dir:
+            list_file = os.path.join(temp_dir, "concat.txt")
+            with open(list_file, "w", encoding="utf-8") as f:
+                for gif_file in gif_files:
+                    escaped = os.path.abspath(gif_file).replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            cmd = [
+                self.processor.ffmpeg.ffmpeg_path, "-y", "-hide_banner",
+                "-loglevel", "error", "-nostats",
+                "-f", "concat", "-safe", "0", "-i", list_file,
+            ]
+            if gifs_stream_copyable(gif_files, final_width, final_height):
+                cmd += ["-c", "copy"]
+            else:
+                if final_height:
+                    scale = f"scale={final_width}:{final_height}:force_original_aspect_ratio=decrease:flags=lanczos"
+                else:
+                    scale = f"scale={final_width}:-1:flags=lanczos"
+                max_colors = GIF_QUALITY_COLORS.get(quality_level, 256)
+                cmd += ["-filter_complex",
+                        f"[0:v]{scale},split[a][b];[a]palettegen=max_colors={max_colors}[p];"
+                        f"[b][p]paletteuse={GIF_DITHER_OPTIONS[dither]}"]
+            cmd.append(merged_file)
+
+            return_code, errors = self._run_ffmpeg_with_progress(cmd)
+        if return_code != 0:
+            return errors or f"FFmpeg process failed with code {return_code}"
+        return None
+
+    def _gpu_decode_available(self) -> bool:
+        """Whether the batched renderer can decode on NVDEC (FFmpeg built with CUDA hwaccel)"""
+        return ffmpeg_has_cuda(self.processor.ffmpeg.ffmpeg_path)
+
+    def _decoder_label(self) -> str:
+        """Decoder description for confirmation screens"""
+        return "NVDEC (CUDA)" if self._gpu_decode_available() else "CPU"
+
+    def _render_gif_batches(self, source_file: str, segments: List[Tuple[float, float]],
+                            batches: List[Tuple[List[Tuple[float, float]], List[str]]],
+                            fps: int, scale_width: int, max_colors: int, threads: int,
+                            process_threads: int, workers: int, shared_palette: bool,
+                            dither: str = "bayer", hwaccel: bool = False) -> List[str]:
+        """Run the palette pass and one FFmpeg process per batch, `workers` at a time; returns error messages"""
+        ffmpeg_path = self.processor.ffmpeg.ffmpeg_path
+
+        def report(block):
+            self.progress.update(0, f"FFmpeg speed {block.get('speed', 'N/A').strip()}")
+
+        palette_file = None
+        if shared_palette:
+            palette_file = shared_palette_path(source_file, segments, fps, scale_width,
+                                               max_colors, hwaccel)
+            if os.path.exists(palette_file):
+                os.utime(palette_file)  # Mark as recently used for pruning
+            else:
+                self.progress.update(0, "Generating shared palette...")
+                # Write under a temporary name so an interrupted run never leaves a partial palette
+                partial_file = f"{palette_file[:-4]}.{os.getpid()}.tmp.png"
+                return_code, error_output = self._run_ffmpeg_with_progress(build_palette_command(
+                    ffmpeg_path, source_file, segments, partial_file,
+                    fps, scale_width, max_colors, threads, hwaccel
+                ))
+                if return_code != 0:
+                    if os.path.exists(partial_file):
+                        os.remove(partial_file)
+                    return [error_output or f"Palette generation failed with code {return_code}"]
+                os.replace(partial_file, palette_file)
+                prune_palette_cache()
+
+        done = 0
+        errors = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for batch_segments, batch_outputs in batches:
+                cmd = build_batched_gif_command(
+                    ffmpeg_path, source_file, batch_segments, batch_outputs,
+                    fps, scale_width, max_colors, process_threads, palette_file, hwaccel, dither
+                )
+                # Per-block progress is only readable with a single process
+                future = executor.submit(
+                    self._run_ffmpeg_with_progress, cmd, report if len(batches) == 1 else None
+                )
+                futures[future] = len(batch_segments)
+
+            for future in as_completed(futures):
+                return_code, error_output = future.result()
+                done += futures[future]
+                self.progress.update(done, f"{done}/{len(segments)} clips rendered")
+                if return_code != 0:
+                    errors.append(error_output or f"FFmpeg process failed with code {return_code}")
+
+        return errors
+
+    def _run_ffmpeg_with_progress(self, cmd: List[str],
+                                  on_progress: Optional[Callable[[dict], None]] = None) -> Tuple[int, str]:
+        """
+        Run an FFmpeg command started with `-progress pipe:1`.
+
+        Each key=value block FFmpeg emits is passed to on_progress once its
+        closing `progress=` line arrives; any other output is kept as errors.
+
+        Returns:
+            Tuple of (return code, error output)
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=PIPE_READ_SIZE
+        )
+
+        block = {}
+        errors = []
+
+        def handle_line(raw: bytes):
+            nonlocal block
+            line = raw.decode("utf-8", "replace").strip()
+            key, sep, value = line.partition("=")
+            if not sep or " " in key:
+                if line:
+                    errors.append(line)
+                return
+
+            block[key] = value
+            if key == "progress":
+                if on_progress:
+                    on_progress(block)
+                block = {}
+
+        # Read whatever the pipe holds per syscall and split lines ourselves
+        fd = process.stdout.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, PIPE_READ_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+            for raw in lines:
+                handle_line(raw)
+        if pending:
+            handle_line(pending)
+        process.stdout.close()
+
+        return process.wait(), "\n".join(errors)
+
     def _manual_intervals(self, source_file: str, total_duration: float):
         """Manual time interval specification"""
         self.ui.print_step("Step 3: Manual Time Intervals")
@@ -304,36 +897,69 @@ class GifCommands:
             self.ui.print_info("No intervals specified")
             return
 
+        # Process in timeline order so neighbouring intervals share decode ranges
+        intervals.sort(key=lambda interval: interval[0])
+
         # Get output settings and proceed with conversion
         self._finalize_gif_creation(source_file, intervals)
 
+    def _prompt_numeric(self, prompt: str, default: Optional[str], cast: Callable,
+                        lo=None, hi=None, err_msg: str = "Value out of range",
+                        lo_exclusive: bool = False):
+        """
+        Prompt until the user enters a number within [lo, hi].
+
+        Args:
+            prompt: Prompt text
+            default: Default shown to the user (None for no default)
+            cast: int or float
+            lo: Lower bound, or None for no lower bound
+            hi: Upper bound, or None for no upper bound
+            err_msg: Message shown when the value is out of range
+            lo_exclusive: Reject values equal to lo
+
+        Returns:
+            Parsed value
+        """
+        while True:
+            text = self.ui.get_input(prompt, default)
+            # Plain digit strings skip the exception path; anything else (signs,
+            # spaces, long numbers) goes through cast so the messages stay the same
+            if cast is int and _INT_INPUT_RE.match(text):
+                value = int(text)
+            else:
+                try:
+                    value = cast(text)
+                except ValueError:
+                    self.ui.print_error("Please enter a valid number")
+                    continue
+
+            above_lo = lo is None or (value > lo if lo_exclusive else value >= lo)
+            if above_lo and (hi is None or value <= hi):
+                return value
+            self.ui.print_error(err_msg)
+
     def _get_fps_setting(self) -> int:
         """Get FPS setting from user"""
-        while True:
-            fps_input = self.ui.get_input("FPS (frames per second)", "10")
-            if not fps_input:
-                return 10
-            try:
-                fps = int(fps_input)
-                if 1 <= fps <= 30:
-                    return fps
-                self.ui.print_error("FPS must be between 1 and 30")
-            except ValueError:
-                self.ui.print_error("Please enter a valid number")
+        return self._prompt_numeric("FPS (frames per second)", "10", int, 1, 30,
+                                    "FPS must be between 1 and 30")
 
     def _get_scale_setting(self) -> int:
         """Get scale width setting from user"""
-        while True:
-            scale_input = self.ui.get_input("Scale width in pixels", "320")
-            if not scale_input:
-                return 320
-            try:
-                scale = int(scale_input)
-                if 100 <= scale <= 1920:
-                    return scale
-                self.ui.print_error("Scale width must be between 100 and 1920 pixels")
-            except ValueError:
-                self.ui.print_error("Please enter a valid number")
+        return self._prompt_numeric("Scale width in pixels", "320", int, 100, 1920,
+                                    "Scale width must be between 100 and 1920 pixels")
+
+    def _get_threads_setting(self) -> int:
+        """Get FFmpeg thread count setting from user"""
+        max_threads = os.cpu_count() or 1
+        return self._prompt_numeric("FFmpeg threads", str(max(1, max_threads // 2)), int, 1, max_threads,
+                                    f"Threads must be between 1 and {max_threads}")
+
+    def _get_jobs_setting(self, threads: int) -> int:
+        """Get number of concurrent FFmpeg processes from user"""
+        max_jobs = os.cpu_count() or 1
+        return self._prompt_numeric("Parallel FFmpeg jobs", str(min(threads, max_jobs)), int, 1, max_jobs,
+                                    f"Jobs must be between 1 and {max_jobs}")
 
     def _get_quality_setting(self) -> str:
         """Get quality level setting from user"""
@@ -354,6 +980,25 @@ class GifCommands:
             else:
                 self.ui.print_error("Please enter 1, 2, or 3")
 
+    def _get_dither_setting(self) -> str:
+        """Get dithering method setting from user"""
+        while True:
+            print("Dithering:")
+            print("1. Bayer (ordered, fast, recommended)")
+            print("2. Floyd-Steinberg (error diffusion, slower)")
+            print("3. None (flat colors, smallest files)")
+            print()
+
+            choice = self.ui.get_input("Select dithering (1-3)", "1")
+            if choice == "1":
+                return "bayer"
+            elif choice == "2":
+                return "floyd_steinberg"
+            elif choice == "3":
+                return "none"
+            else:
+                self.ui.print_error("Please enter 1, 2, or 3")
+
     def _get_final_gif_resolution_setting(self, source_file: str) -> Tuple[int, int]:
         """Get final GIF resolution setting from user"""
         print()
@@ -361,7 +1006,7 @@ class GifCommands:
         print("This controls the resolution of the final merged GIF (not individual clips)")
         
         # Get source video resolution for reference
-        media_info = self.processor.get_media_info(source_file)
+        media_info = cached_media_info(self.processor, source_file)
         if media_info:
             source_res = f"{media_info.width}x{media_info.height}"
             print(f"-> Source video resolution: {Colors.colorize(source_res, Colors.CYAN)}")
@@ -424,10 +1069,19 @@ class GifCommands:
         scale_width = self._get_scale_setting()
         create_thumbnails = self.ui.confirm_action("Create thumbnail images?", default=True)
 
+        # Dither and thread settings only apply to the batched renderer (no thumbnails)
+        dither = threads = jobs = None
+        if not create_thumbnails:
+            dither = self._get_dither_setting()
+            threads = self._get_threads_setting()
+            jobs = self._get_jobs_setting(threads)
+
         # Confirmation
         self.ui.print_step("Step 4: Confirmation")
         print(f"-> Source: {Colors.colorize(source_file, Colors.YELLOW)}")
         print(f"-> Intervals: {Colors.colorize(str(len(intervals)), Colors.GREEN)} clips")
+        if not create_thumbnails:
+            print(f"-> Decoder: {Colors.colorize(self._decoder_label(), Colors.BLUE)}")
         for i, (start, end) in enumerate(intervals, 1):
             start_str = self.ui.format_duration(start)
             end_str = self.ui.format_duration(end)
@@ -443,113 +1097,138 @@ class GifCommands:
         # Start progress tracking
         self.progress.start(len(intervals), "Processing intervals...")
 
-        result = self.processor.create_gif_clips(
-            source_file=source_file,
-            intervals=intervals,
-            output_name=output_name,
-            fps=fps,
-            scale_width=scale_width,
-            create_thumbnails=create_thumbnails
-        )
+        if not create_thumbnails:
+            segments = [(start, end - start) for start, end in intervals]
+            result = self._create_gif_clips_batched(
+                source_file, segments, output_name, fps, scale_width,
+                threads=threads, jobs=jobs, dither=dither
+            )
+        else:
+            result = self.processor.create_gif_clips(
+                source_file=source_file,
+                intervals=intervals,
+                output_name=output_name,
+                fps=fps,
+                scale_width=scale_width,
+                create_thumbnails=create_thumbnails
+            )
 
         self.progress.finish("GIF creation completed!")
         self._display_gif_results(result)
 
     def _display_gif_results(self, result):
         """Display standard GIF conversion results"""
-        if result.success:
-            self.ui.print_header("GIF CREATION RESULTS")
-            self.ui.print_success(f"Successfully created {len(result.gif_files)} GIF(s)")
-            print()
+        colorize = Colors.colorize
+        fmt_dur = self.ui.format_duration
+        fmt_size = self.ui.format_file_size
+
+        # Collect the report and emit it in one write
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            if result.success:
+                self.ui.print_header("GIF CREATION RESULTS")
+                self.ui.print_success(f"Successfully created {len(result.gif_files)} GIF(s)")
+                print()
 
-            print("-> GIF files:")
-            for i, gif_file in enumerate(result.gif_files, 1):
-                size = self.ui.get_file_size(gif_file) if os.path.exists(gif_file) else 0
-                size_str = self.ui.format_file_size(size)
-                print(f"   {i}. {Colors.colorize(gif_file, Colors.GREEN)} ({Colors.colorize(size_str, Colors.BLUE)})")
+                print("-> GIF files:")
+                for i, gif_file in enumerate(result.gif_files, 1):
+                    size = _safe_size(gif_file)
+                    size_str = fmt_size(size)
+                    print(f"   {i}. {colorize(gif_file, Colors.GREEN)} ({colorize(size_str, Colors.BLUE)})")
 
-            if result.thumbnail_files:
-                print()
-                print("-> Thumbnail files:")
-                for i, thumb_file in enumerate(result.thumbnail_files, 1):
-                    print(f"   {i}. {Colors.colorize(thumb_file, Colors.CYAN)}")
+                if result.thumbnail_files:
+                    print()
+                    print("-> Thumbnail files:")
+                    for i, thumb_file in enumerate(result.thumbnail_files, 1):
+                        print(f"   {i}. {colorize(thumb_file, Colors.CYAN)}")
 
-            print()
-            print(f"-> Total duration: {Colors.colorize(self.ui.format_duration(result.total_duration), Colors.YELLOW)}")
-            print(f"-> Processing time: {Colors.colorize(f'{result.processing_time:.1f}s', Colors.YELLOW)}")
+                print()
+                print(f"-> Total duration: {colorize(fmt_dur(result.total_duration), Colors.YELLOW)}")
+                print(f"-> Processing time: {colorize(f'{result.processing_time:.1f}s', Colors.YELLOW)}")
 
-        else:
-            self.ui.print_error("GIF creation failed")
-            if result.error_message:
-                print(f"Error: {Colors.colorize(result.error_message, Colors.RED)}")
+            else:
+                self.ui.print_error("GIF creation failed")
+                if result.error_message:
+                    print(f"Error: {colorize(result.error_message, Colors.RED)}")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
         self.ui.wait_for_enter()
 
     def _display_enhanced_gif_results(self, result):
         """Display GIF conversion results with media info and merged files"""
-        if result.success:
-            self.ui.print_header("GIF CREATION RESULTS")
-            
-            # Show media info if available
-            if result.media_info:
-                print("-> Video Information:")
-                info = result.media_info
-                print(f"   Format: {Colors.colorize(info.get('format', 'Unknown'), Colors.CYAN)}")
-                print(f"   Duration: {Colors.colorize(self._format_duration_from_str(info.get('duration', '0')), Colors.CYAN)}")
-                resolution_str = f"{info.get('width', '0')}x{info.get('height', '0')}"
-                print(f"   Resolution: {Colors.colorize(resolution_str, Colors.CYAN)}")
+        colorize = Colors.colorize
+        fmt_dur = self.ui.format_duration
+        fmt_size = self.ui.format_file_size
+
+        # Collect the report and emit it in one write
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            if result.success:
+                self.ui.print_header("GIF CREATION RESULTS")
+
+                # Show media info if available
+                if result.media_info:
+                    print("-> Video Information:")
+                    info = result.media_info
+                    print(f"   Format: {colorize(info.get('format', 'Unknown'), Colors.CYAN)}")
+                    print(f"   Duration: {colorize(self._format_duration_from_str(info.get('duration', '0')), Colors.CYAN)}")
+                    resolution_str = f"{info.get('width', '0')}x{info.get('height', '0')}"
+                    print(f"   Resolution: {colorize(resolution_str, Colors.CYAN)}")
+                    print()
+
+                self.ui.print_success(f"Successfully created {len(result.gif_files)} file(s)")
                 print()
-            
-            self.ui.print_success(f"Successfully created {len(result.gif_files)} file(s)")
-            print()
-
-            # Separate individual GIFs from merged files
-            individual_gifs = [f for f in result.gif_files if not f.endswith('_merged.gif')]
-            merged_gifs = [f for f in result.gif_files if f.endswith('_merged.gif')]
-            
-            individual_thumbs = [f for f in result.thumbnail_files if not f.endswith('_grid.png')]
-            grid_thumbs = [f for f in result.thumbnail_files if f.endswith('_grid.png')]
-
-            # Display individual GIF clips
-            if individual_gifs:
-                print("-> Individual GIF clips:")
-                for i, gif_file in enumerate(individual_gifs, 1):
-                    size = self.ui.get_file_size(gif_file) if os.path.exists(gif_file) else 0
-                    size_str = self.ui.format_file_size(size)
-                    print(f"   {i}. {Colors.colorize(gif_file, Colors.GREEN)} ({Colors.colorize(size_str, Colors.BLUE)})")
-
-            # Display merged GIF
-            if merged_gifs:
-                print("\n-> Merged GIF file:")
-                for gif_file in merged_gifs:
-                    size = self.ui.get_file_size(gif_file) if os.path.exists(gif_file) else 0
-                    size_str = self.ui.format_file_size(size)
-                    print(f"   {Colors.colorize(gif_file, Colors.YELLOW)} ({Colors.colorize(size_str, Colors.BLUE)})")
-
-            # Display grid thumbnail
-            if grid_thumbs:
-                print("\n-> Thumbnail grid with media info:")
-                for thumb_file in grid_thumbs:
-                    size = self.ui.get_file_size(thumb_file) if os.path.exists(thumb_file) else 0
-                    size_str = self.ui.format_file_size(size)
-                    print(f"   {Colors.colorize(thumb_file, Colors.MAGENTA)} ({Colors.colorize(size_str, Colors.BLUE)})")
 
-            # Display individual thumbnails
-            if individual_thumbs:
-                print("\n-> Individual thumbnails:")
-                for i, thumb_file in enumerate(individual_thumbs, 1):
-                    print(f"   {i}. {Colors.colorize(thumb_file, Colors.CYAN)}")
-            elif grid_thumbs:
-                print(f"\n-> Individual thumbnails: {Colors.colorize('Cleaned up (removed)', Colors.YELLOW)}")
+                # Separate individual GIFs from merged files
+                individual_gifs = [f for f in result.gif_files if not f.endswith('_merged.gif')]
+                merged_gifs = [f for f in result.gif_files if f.endswith('_merged.gif')]
+
+                individual_thumbs = [f for f in result.thumbnail_files if not f.endswith('_grid.png')]
+                grid_thumbs = [f for f in result.thumbnail_files if f.endswith('_grid.png')]
+
+                # Display individual GIF clips
+                if individual_gifs:
+                    print("-> Individual GIF clips:")
+                    for i, gif_file in enumerate(individual_gifs, 1):
+                        size = _safe_size(gif_file)
+                        size_str = fmt_size(size)
+                        print(f"   {i}. {colorize(gif_file, Colors.GREEN)} ({colorize(size_str, Colors.BLUE)})")
+
+                # Display merged GIF
+                if merged_gifs:
+                    print("\n-> Merged GIF file:")
+                    for gif_file in merged_gifs:
+                        size = _safe_size(gif_file)
+                        size_str = fmt_size(size)
+                        print(f"   {colorize(gif_file, Colors.YELLOW)} ({colorize(size_str, Colors.BLUE)})")
+
+                # Display grid thumbnail
+                if grid_thumbs:
+                    print("\n-> Thumbnail grid with media info:")
+                    for thumb_file in grid_thumbs:
+                        size = _safe_size(thumb_file)
+                        size_str = fmt_size(size)
+                        print(f"   {colorize(thumb_file, Colors.MAGENTA)} ({colorize(size_str, Colors.BLUE)})")
+
+                # Display individual thumbnails
+                if individual_thumbs:
+                    print("\n-> Individual thumbnails:")
+                    for i, thumb_file in enumerate(individual_thumbs, 1):
+                        print(f"   {i}. {colorize(thumb_file, Colors.CYAN)}")
+                elif grid_thumbs:
+                    print(f"\n-> Individual thumbnails: {colorize('Cleaned up (removed)', Colors.YELLOW)}")
 
-            print()
-            print(f"-> Total GIF duration: {Colors.colorize(self.ui.format_duration(result.total_duration), Colors.YELLOW)}")
-            print(f"-> Processing time: {Colors.colorize(f'{result.processing_time:.1f}s', Colors.YELLOW)}")
+                print()
+                print(f"-> Total GIF duration: {colorize(fmt_dur(result.total_duration), Colors.YELLOW)}")
+                print(f"-> Processing time: {colorize(f'{result.processing_time:.1f}s', Colors.YELLOW)}")
 
-        else:
-            self.ui.print_error("Enhanced GIF creation failed")
-            if result.error_message:
-                print(f"Error: {Colors.colorize(result.error_message, Colors.RED)}")
+            else:
+                self.ui.print_error("Enhanced GIF creation failed")
+                if result.error_message:
+                    print(f"Error: {colorize(result.error_message, Colors.RED)}")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
         self.ui.wait_for_enter()
 
@@ -557,9 +1236,9 @@ class GifCommands:
         """Format duration from string seconds to HH:MM:SS"""
         try:
             seconds = float(duration_str)
-            return self.ui.format_duration(seconds)
-        except:
+        except (TypeError, ValueError):
             return duration_str
+        return self.ui.format_duration(seconds)
         
     def _choose_gif_method(self) -> str:
         """Choose GIF creation method"""
@@ -588,7 +1267,7 @@ class GifCommands:
 
             # Get video info
             self.ui.print_info("Analyzing video file...")
-            media_info = self.processor.get_media_info(source_file)
+            media_info = cached_media_info(self.processor, source_file)
             if not media_info:
                 self.ui.print_error("Could not analyze video file")
                 return
@@ -780,7 +1459,7 @@ class GifCommands:
             if result.gif_files:
                 print("-> Final GIF Output:")
                 gif_file = result.gif_files[0]  # Should be the merged GIF
-                size = self.ui.get_file_size(gif_file) if os.path.exists(gif_file) else 0
+                size = _safe_size(gif_file)
                 size_str = self.ui.format_file_size(size)
                 print(f"   {Colors.colorize(gif_file, Colors.YELLOW)} ({Colors.colorize(size_str, Colors.BLUE)})")
 
@@ -789,7 +1468,7 @@ class GifCommands:
             if grid_thumbs:
                 print("\n-> Thumbnail Grid:")
                 for thumb_file in grid_thumbs:
-                    size = self.ui.get_file_size(thumb_file) if os.path.exists(thumb_file) else 0
+                    size = _safe_size(thumb_file)
                     size_str = self.ui.format_file_size(size)
                     print(f"   {Colors.colorize(thumb_file, Colors.MAGENTA)} ({Colors.colorize(size_str, Colors.BLUE)})")
 
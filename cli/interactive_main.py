@@ -4,16 +4,25 @@ Enhancement: Press 'q' to cancel operations and return to menu
 """
 import sys
 import os
+import io
 import re
+import codecs
+import asyncio
 import threading
 import time
 import subprocess
-import select
+import shutil
+import selectors
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple
+from .commands import CLICommands, cached_media_info, task_succeeded
 from .gif_commands import GifCommands
 from .scale_encode_command import ScaleEncodeCommand
-from .ui import CLIFormatter
+from .ui import CLIFormatter, TIME_FORMAT_ERROR, parse_end_time, parse_time_seconds, configure_stdout_buffering
 
 # Import the video processing library
 try:
@@ -23,54 +32,311 @@ except ImportError:
     sys.path.insert(0, str(Path(__file__).parent.parent))
     import videolib
 
+from videolib.core.clipper import ClipOptions, ClipInterval
+from videolib.core.splitter import SplitOptions
+
+# Section separators, built once instead of on every menu render
+_EQ50 = "=" * 50
+_DASH50 = "-" * 50
+_DASH35 = "-" * 35
+_DASH25 = "-" * 25
+_DASH20 = "-" * 20
+
+# Bytes read from FFmpeg's output pipe per call
+PIPE_READ_SIZE = 65536
+
+# Stream buffer limit for the download subprocess (asyncio pauses at twice this)
+PIPE_BUFFER_LIMIT = 1024 * 1024
+
+# FFmpeg progress fields parsed by FFmpegMonitor, one named group per field
+_PROGRESS_RE = re.compile(
+    r'fps=\s*(?P<fps>\d+(?:\.\d+)?)'
+    r'|time=(?P<time>\d+:\d+:\d+\.\d+)'
+    r'|bitrate=\s*(?P<bitrate>[\d.]+\w+)'
+    r'|speed=\s*(?P<speed>[\d.]+x)'
+    r'|size=\s*(?P<size>[\d.]+\w+)'
+    r'|drop=(?P<drop>\d+)'
+    r'|dup=(?P<dup>\d+)'
+)
+
+# ProgressTracker bar width (short to make room for the interrupt hint); every
+# bar is a slice of the master string instead of two fresh strings per repaint
+BAR_LENGTH = 25
+_BAR_MASTER = '=' * BAR_LENGTH + '-' * BAR_LENGTH
+
+# Win32 constants used by KeyboardListener._listen_windows
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0
+WAIT_TIMEOUT_MS = 1000
+
+# FFmpegMonitor status line layout: (stat, label, starting field width); a
+# field widens for the rest of the run when a value outgrows it
+_STATS_FIELDS = (
+    ('time', "Time: ", 8),
+    ('size', " | Size: ", 9),
+    ('bitrate', " | Bitrate: ", 13),
+    ('speed', " | Speed: ", 5),
+    ('fps', " | FPS: ", 5),
+)
+_STATS_SUFFIX = " | Press 'q' to cancel"
+
+# `-progress` records are single key=value lines: key -> (stat, value converter)
+_PROGRESS_HANDLERS = {
+    'out_time': ('time', lambda v: v[:8]),  # Remove microseconds
+    'total_size': ('size', lambda v: f"{int(v) // 1024}kB" if v.isdecimal() else None),
+    'bitrate': ('bitrate', None),
+    'speed': ('speed', None),
+    'fps': ('fps', None),
+    'drop_frames': ('drop', None),
+    'dup_frames': ('dup', None),
+}
+
+# Result listings with at least this many files stat them from a small thread
+# pool; the calls are I/O-bound, so slow or network storage overlaps them
+PARALLEL_STAT_THRESHOLD = 16
+STAT_WORKERS = 8
+
+def _entry_size(entry: os.DirEntry) -> Optional[int]:
+    """Size of a scandir entry, or None if it cannot be stat'ed"""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return None
+
+def _collect_sizes(paths) -> Dict[str, Optional[int]]:
+    """Return {path: size in bytes or None} with one directory scan per parent
+    
+    Outputs of a split or clip run share a directory, so the sizes come from the
+    scandir entries instead of a separate stat() per path (on Windows the size
+    is part of the directory listing itself).
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), {})[os.path.basename(path)] = path
+    
+    matches = []  # (path, DirEntry) for every requested file that exists
+    for directory, wanted in by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                matches.extend(
+                    (wanted[entry.name], entry) for entry in entries if entry.name in wanted
+                )
+        except OSError:
+            continue
+    
+    sizes = dict.fromkeys(paths)
+    if len(matches) >= PARALLEL_STAT_THRESHOLD and not sys.platform.startswith('win'):
+        # Windows fills DirEntry.stat() from the listing; elsewhere it is a syscall
+        with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+            sizes.update(zip((path for path, _ in matches),
+                             pool.map(_entry_size, [entry for _, entry in matches])))
+    else:
+        sizes.update((path, _entry_size(entry)) for path, entry in matches)
+    return sizes
+
+def _status_writer():
+    """Return a function that writes a status line to stdout and flushes it
+    
+    On a real POSIX terminal this is a single os.write() of the encoded text,
+    bypassing the text I/O layer; elsewhere (pipes, IDE consoles, Windows
+    consoles) it falls back to sys.stdout.write plus flush.
+    """
+    stream = sys.stdout
+    try:
+        fd = stream.fileno() if stream.isatty() else None
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    
+    if fd is None or sys.platform.startswith('win'):
+        def write(text: str):
+            stream.write(text)
+            stream.flush()
+        return write
+    
+    stream.flush()  # Anything already buffered must reach the terminal first
+    encoding = getattr(stream, 'encoding', None) or 'utf-8'
+    
+    def write(text: str):
+        os.write(fd, text.encode(encoding, 'replace'))
+    return write
+
+class DownloadResult(NamedTuple):
+    """Result of InteractiveCLI._download_with_interrupt_support"""
+    success: bool
+    output_file: str
+    file_size: Optional[int]
+    error_message: Optional[str]
+
+class _ReusableThread:
+    """Long-lived daemon thread that runs `target` once per start()"""
+    
+    def __init__(self, target):
+        self._target = target
+        self._go = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+    
+    def start(self):
+        """Run the target again, creating the OS thread on first use"""
+        self._idle.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._go.set()
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the current run to finish; the thread itself stays alive"""
+        return self._idle.wait(timeout)
+    
+    def _run(self):
+        while True:
+            self._go.wait()
+            self._go.clear()
+            try:
+                self._target()
+            except Exception as e:
+                # Keep the worker alive so later start() calls still run the target
+                sys.stderr.write(f"\nX Background task failed: {e}\n")
+            finally:
+                if not self._go.is_set():
+                    self._idle.set()
+
 class KeyboardListener:
     """Listen for keyboard input during background operations"""
     
     def __init__(self):
         self.should_quit = False
         self.listening = False
-        self.listener_thread = None
+        self.on_quit = None  # Optional callback run from the listener thread on 'q'
+        self._wake_r = self._wake_w = None
+        self._wake_event = None
+        self._selector = None
         
-    def start_listening(self):
-        """Start listening for 'q' key press"""
-        self.should_quit = False
-        self.listening = True
+        if sys.platform.startswith('win'):
+            # Auto-reset event: stop_listening signals it to end the wait early
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.CreateEventW.restype = ctypes.c_void_p
+                kernel32.GetStdHandle.restype = ctypes.c_void_p
+                self._wake_event = kernel32.CreateEventW(None, False, False, None) or None
+            except (ImportError, AttributeError, OSError):
+                pass
+        else:
+            # Self-pipe: stop_listening writes a byte to wake the blocked select()
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+            # Kept for the listener's lifetime; stdin is registered on first use
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._wake_r, selectors.EVENT_READ)
         
         if sys.platform.startswith('win'):
             # Windows implementation
-            self.listener_thread = threading.Thread(target=self._listen_windows, daemon=True)
+            self.listener_thread = _ReusableThread(self._listen_windows)
         else:
             # Unix/Linux/macOS implementation
-            self.listener_thread = threading.Thread(target=self._listen_unix, daemon=True)
+            self.listener_thread = _ReusableThread(self._listen_unix)
         
+    def start_listening(self):
+        """Start listening for 'q' key press"""
+        self.should_quit = False
+        self.listening = True
+        sys.stdout.flush()  # Show everything printed before the operation blocks
+        self._drain_wakeups()
         self.listener_thread.start()
     
     def stop_listening(self):
         """Stop listening for keyboard input"""
         self.listening = False
-        if self.listener_thread:
-            self.listener_thread.join(timeout=0.5)
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'x')
+            except BlockingIOError:
+                pass  # A wakeup is already pending
+        if self._wake_event is not None:
+            import ctypes
+            ctypes.windll.kernel32.SetEvent(ctypes.c_void_p(self._wake_event))
+        self.listener_thread.join(timeout=0.5)
+    
+    def _drain_wakeups(self):
+        """Discard wakeups left over from earlier stop_listening calls"""
+        if self._wake_event is not None:
+            import ctypes
+            ctypes.windll.kernel32.ResetEvent(ctypes.c_void_p(self._wake_event))
+        if self._wake_r is None:
+            return
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+    
+    def _request_quit(self):
+        """Flag the quit request and notify whoever is waiting on it"""
+        self.should_quit = True
+        callback = self.on_quit
+        if callback is not None:
+            callback()
     
     def _listen_windows(self):
         """Windows keyboard listener using msvcrt"""
         try:
             import msvcrt
+            if self._wake_event is not None and sys.stdin.isatty():
+                self._listen_windows_wait(msvcrt)
+                return
+            
+            # Polling fallback when the console handle cannot be waited on
             while self.listening and not self.should_quit:
                 if msvcrt.kbhit():
                     key = msvcrt.getch().decode('utf-8', errors='ignore').lower()
                     if key == 'q':
-                        self.should_quit = True
+                        self._request_quit()
                         break
                 time.sleep(0.1)
         except ImportError:
             # Fallback for Windows without msvcrt
             pass
     
+    def _listen_windows_wait(self, msvcrt):
+        """Sleep in WaitForMultipleObjects until console input or stop_listening"""
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        stdin_handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+        handles = (ctypes.c_void_p * 2)(stdin_handle, self._wake_event)
+        
+        while self.listening and not self.should_quit:
+            result = kernel32.WaitForMultipleObjects(2, handles, False, WAIT_TIMEOUT_MS)
+            if result == WAIT_OBJECT_0 + 1:
+                break  # Woken by stop_listening
+            if result != WAIT_OBJECT_0:
+                continue  # Timeout; re-check the flags
+            
+            if not msvcrt.kbhit():
+                # Signalled by non-key events (key-up, mouse, focus); discard
+                # them or the handle stays signalled and the wait spins
+                kernel32.FlushConsoleInputBuffer(ctypes.c_void_p(stdin_handle))
+                continue
+            while msvcrt.kbhit():
+                key = msvcrt.getch().decode('utf-8', errors='ignore').lower()
+                if key == 'q':
+                    self._request_quit()
+                    return
+    
     def _listen_unix(self):
-        """Unix/Linux/macOS keyboard listener using select"""
+        """Unix/Linux/macOS keyboard listener using a persistent selector"""
         try:
             import termios
             import tty
+        except ImportError:
+            return  # Fallback for systems without termios
+        
+        try:
+            stdin_fd = sys.stdin.fileno()
+            if stdin_fd not in self._selector.get_map():
+                self._selector.register(stdin_fd, selectors.EVENT_READ)
             
             # Save terminal settings
             old_settings = termios.tcgetattr(sys.stdin)
@@ -80,19 +346,22 @@ class KeyboardListener:
                 tty.setraw(sys.stdin.fileno())
                 
                 while self.listening and not self.should_quit:
-                    # Check if input is available
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
+                    # Sleep until a key arrives or stop_listening wakes us
+                    ready = [key.fd for key, _ in self._selector.select()]
+                    if self._wake_r in ready:
+                        break
+                    if stdin_fd in ready:
                         key = sys.stdin.read(1).lower()
                         if key == 'q':
-                            self.should_quit = True
+                            self._request_quit()
                             break
                     
             finally:
                 # Restore terminal settings
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
                 
-        except (ImportError, OSError):
-            # Fallback for systems without termios/select
+        except (OSError, termios.error):
+            # stdin is not a terminal (piped/redirected) or cannot be selected on
             pass
 
 class FFmpegMonitor:
@@ -109,134 +378,174 @@ class FFmpegMonitor:
             'dup': '0'
         }
         self.running = False
-        self.display_thread = None
+        self.display_thread = _ReusableThread(self._display_stats)
         self.keyboard_listener = keyboard_listener
+        # Set whenever a stat changes; the display thread repaints only then
+        self._dirty = threading.Event()
         
     def start_display(self, operation_name: str = "Processing"):
         """Start real-time statistics display with interrupt support"""
         self.running = True
         self.operation_name = operation_name
-        self.display_thread = threading.Thread(target=self._display_stats, daemon=True)
+        self._widths = {key: width for key, _, width in _STATS_FIELDS}
+        self._layout()
+        self._rendered = None  # Stats last drawn; None forces a full line
+        
+        self._dirty.set()  # Draw the initial line straight away
         self.display_thread.start()
     
+    def _layout(self):
+        """Build the status line templates for the current field widths"""
+        prefix = f"\r{self.operation_name} -> "
+        
+        # %-Ws pads each field to its width without clipping longer values
+        template = [prefix.replace('%', '%%')]
+        self._cells = []  # (stat, template that moves to the field and redraws it)
+        col = len(prefix)  # 1-based column; the leading \r takes none
+        for key, label, _ in _STATS_FIELDS:
+            width = self._widths[key]
+            template.append(f"{label}%({key})-{width}s")
+            col += len(label)
+            self._cells.append((key, f"\x1b[{col}G%-{width}s"))
+            col += width
+        template.append(_STATS_SUFFIX)
+        self._template = ''.join(template)
+        self._end_column = col + len(_STATS_SUFFIX)  # Just past the last character
+        self._park = f"\x1b[{self._end_column}G"
+        # Field-level repaints need ANSI cursor moves and a line that is never
+        # truncated (the full line is one \r plus end_column - 1 characters)
+        self._ansi = sys.stdout.isatty() and self._end_column <= 120
+    
     def stop_display(self):
         """Stop statistics display"""
         self.running = False
-        if self.display_thread:
-            self.display_thread.join(timeout=1)
+        self._dirty.set()  # Wake the display thread so it exits immediately
+        self.display_thread.join(timeout=1)
         print()  # New line after stats
     
     def parse_ffmpeg_line(self, line: str):
         """Parse FFmpeg progress line for statistics"""
-        if not line:
+        key, _, value = line.partition('=')
+        handler = _PROGRESS_HANDLERS.get(key)
+        if handler is not None:
+            # Fast path for `-progress` records; no regex needed
+            field, convert = handler
+            value = value.strip()
+            if value == 'N/A':
+                return
+            if convert is not None:
+                value = convert(value)
+            if value is not None:
+                self._set_stat(field, value)
             return
-            
-        try:
-            # Parse frame rate
-            if 'fps=' in line:
-                fps_match = re.search(r'fps=\s*(\d+(?:\.\d+)?)', line)
-                if fps_match:
-                    self.stats['fps'] = fps_match.group(1)
-            
-            # Parse current time
-            if 'time=' in line:
-                time_match = re.search(r'time=(\d+:\d+:\d+\.\d+)', line)
-                if time_match:
-                    self.stats['time'] = time_match.group(1)[:8]  # Remove milliseconds
-            
-            # Parse bitrate
-            if 'bitrate=' in line:
-                bitrate_match = re.search(r'bitrate=\s*([\d.]+\w+)', line)
-                if bitrate_match:
-                    self.stats['bitrate'] = bitrate_match.group(1)
-            
-            # Parse speed
-            if 'speed=' in line:
-                speed_match = re.search(r'speed=\s*([\d.]+x)', line)
-                if speed_match:
-                    self.stats['speed'] = speed_match.group(1)
-            
-            # Parse size
-            if 'size=' in line:
-                size_match = re.search(r'size=\s*([\d.]+\w+)', line)
-                if size_match:
-                    self.stats['size'] = size_match.group(1)
-            
-            # Parse drop/dup frames
-            if 'drop=' in line:
-                drop_match = re.search(r'drop=(\d+)', line)
-                if drop_match:
-                    self.stats['drop'] = drop_match.group(1)
-            
-            if 'dup=' in line:
-                dup_match = re.search(r'dup=(\d+)', line)
-                if dup_match:
-                    self.stats['dup'] = dup_match.group(1)
-                    
-        except Exception as e:
-            # Ignore parsing errors to avoid interrupting the display
-            pass
+        
+        # Status/log lines: one scan per line, each match names its field
+        for match in _PROGRESS_RE.finditer(line):
+            field = match.lastgroup
+            value = match.group(field)
+            if field == 'time':
+                value = value[:8]  # Remove milliseconds
+            self._set_stat(field, value)
+    
+    def _set_stat(self, field: str, value: str):
+        """Store a stat and flag a repaint if it changed"""
+        if self.stats[field] != value:
+            self.stats[field] = value
+            self._dirty.set()
     
     def _display_stats(self):
         """Display real-time FFmpeg statistics with interrupt hint"""
+        write = _status_writer()
         while self.running and not self.keyboard_listener.should_quit:
-            stats_line = (
-                f"\r{self.operation_name} -> "
-                f"Time: {self.stats['time']} | "
-                f"Size: {self.stats['size']} | "
-                f"Bitrate: {self.stats['bitrate']} | "
-                f"Speed: {self.stats['speed']} | "
-                f"FPS: {self.stats['fps']} | Press 'q' to cancel"
-            )
-            
-            # Truncate if too long for terminal
-            if len(stats_line) > 120:
-                stats_line = stats_line[:115] + "..."
-            
-            print(stats_line, end='', flush=True)
-            time.sleep(0.5)
+            # Wait for a change; the timeout keeps the quit flag polled
+            if not self._dirty.wait(timeout=0.5):
+                continue
+            self._dirty.clear()
+            if not self.running:
+                break
+            stats = dict(self.stats)  # Snapshot; the reader keeps updating it
+            rendered = self._rendered
+            
+            # A value wider than its field would shift the fields after it, so
+            # widen the field and redraw the whole (now longer) line
+            overflow = {
+                key: len(stats[key]) for key, width in self._widths.items()
+                if len(stats[key]) > width
+            }
+            if overflow:
+                self._widths.update(overflow)
+                self._layout()
+                rendered = None
+            
+            if self._ansi and rendered is not None:
+                # Move to each changed field and overwrite just its cells
+                parts = [
+                    cell % stats[key] for key, cell in self._cells
+                    if stats[key] != rendered[key]
+                ]
+                if parts:
+                    parts.append(self._park)  # Leave the cursor at end of line
+                    write(''.join(parts))
+            else:
+                stats_line = self._template % stats
+                
+                # Truncate if too long for terminal
+                if len(stats_line) > 120:
+                    stats_line = stats_line[:115] + "..."
+                
+                write(stats_line)
+            self._rendered = stats
 
 class ProgressTracker:
     """Track and display progress for long-running operations with interrupt support"""
     
     def __init__(self, keyboard_listener):
         self.running = False
-        self.thread = None
+        self.thread = _ReusableThread(self._display_progress)
         self.progress = 0
         self.message = ""
         self.keyboard_listener = keyboard_listener
+        # Set by update(); the display thread repaints only when it is set
+        self._dirty = threading.Event()
     
     def start(self, message: str = "Processing..."):
         """Start progress display with interrupt support"""
         self.message = message
         self.running = True
         self.progress = 0
-        self.thread = threading.Thread(target=self._display_progress, daemon=True)
+        self._dirty.set()  # Draw the empty bar straight away
         self.thread.start()
     
     def update(self, progress: int, message: str = None):
         """Update progress (0-100)"""
-        self.progress = min(100, max(0, progress))
-        if message:
-            self.message = message
+        progress = min(100, max(0, progress))
+        if progress != self.progress or (message and message != self.message):
+            self.progress = progress
+            if message:
+                self.message = message
+            self._dirty.set()
     
     def stop(self):
         """Stop progress display"""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1)
+        self._dirty.set()  # Wake the display thread so it exits immediately
+        self.thread.join(timeout=1)
         print()  # New line after progress
     
     def _display_progress(self):
         """Display progress bar in separate thread with interrupt hint"""
+        write = _status_writer()
         while self.running and not self.keyboard_listener.should_quit:
-            bar_length = 25  # Shorter to make room for interrupt hint
-            filled = int(bar_length * self.progress / 100)
-            bar = '=' * filled + '-' * (bar_length - filled)
+            if not self._dirty.wait(timeout=0.5):
+                continue
+            self._dirty.clear()
+            if not self.running:
+                break
+            filled = BAR_LENGTH * self.progress // 100
+            bar = _BAR_MASTER[BAR_LENGTH - filled:2 * BAR_LENGTH - filled]
             
             progress_line = f"\r[{bar}] {self.progress:3d}% {self.message} | Press 'q' to cancel"
-            print(progress_line, end='', flush=True)
-            time.sleep(0.5)
+            write(progress_line)
 
 class InteractiveCLI:
     """Interactive command-line interface with 'q' key interrupt support"""
@@ -248,6 +557,26 @@ class InteractiveCLI:
         self.progress_tracker = ProgressTracker(self.keyboard_listener)
         self.ffmpeg_monitor = FFmpegMonitor(self.keyboard_listener)
         self.gif_commands = GifCommands()
+        # (ffmpeg path, mtime_ns) -> first line of `ffmpeg -version`
+        self._ffmpeg_version_cache: Dict[Tuple[str, int], str] = {}
+        
+        # Menu choice -> handler; bound once so each selection is one dict lookup
+        self._menu_actions = {
+            '0': self._quit,
+            '1': self.download_video_interactive,
+            '2': self.split_video_interactive,
+            '3': self.create_clips_interactive,
+            '4': self.gif_commands.create_gif_clips_interactive,
+            '5': self.create_scale_encode_interactive,
+            '6': self.get_media_info_interactive,
+            '7': self.batch_process_interactive,
+            '8': self.settings_menu,
+        }
+        self._settings_actions = {
+            '1': self._reinitialize_processor,
+            '2': self.check_ffmpeg_version,
+            '3': self.test_media_file,
+        }
         
     def initialize_processor(self):
         """Initialize video processor with custom FFmpeg paths if needed"""
@@ -282,9 +611,9 @@ class InteractiveCLI:
     
     def show_menu(self):
         """Display main menu with simple symbols"""
-        print("\n" + "=" * 50)
+        print("\n" + _EQ50)
         print("MAIN MENU")
-        print("=" * 50)
+        print(_EQ50)
         print("1. Download Video (Enhanced monitoring)")
         print("2. Split Video by Size") 
         print("3. Create Video Clips")
@@ -294,7 +623,7 @@ class InteractiveCLI:
         print("7. Batch Process from Config File")
         print("8. Settings")
         print("0. Exit")
-        print("=" * 50)
+        print(_EQ50)
         print("Tip: During operations, press 'q' to cancel and return to menu")
     
     def get_input(self, prompt: str, default: Optional[str] = None) -> str:
@@ -354,7 +683,9 @@ class InteractiveCLI:
                         continue
                 return file_path
     
-    def truncate_path(self, path: str, max_length: int = 40) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def truncate_path(path: str, max_length: int = 40) -> str:
         """Truncate long paths for display"""
         if len(path) <= max_length:
             return path
@@ -377,7 +708,9 @@ class InteractiveCLI:
         else:
             return f".../{name[:max_length-7]}..."
     
-    def truncate_filename(self, filename: str, max_length: int = 30) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def truncate_filename(filename: str, max_length: int = 30) -> str:
         """Truncate filename for display"""
         if len(filename) <= max_length:
             return filename
@@ -395,25 +728,44 @@ class InteractiveCLI:
         """Pause and wait for user input"""
         input(f"\n-> {message}")
     
+    @contextmanager
+    def _progress_and_keys(self, message: str):
+        """Show a progress line and listen for 'q' while the block runs"""
+        self.keyboard_listener.start_listening()
+        self.progress_tracker.start(message)
+        try:
+            yield
+        finally:
+            self.progress_tracker.stop()
+            self.keyboard_listener.stop_listening()
+    
+    @staticmethod
+    def _emit_block(lines: List[str]):
+        """Write several output lines with a single write and flush"""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+    
     def download_video_interactive(self):
         """Interactive download video workflow with 'q' interrupt support"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("VIDEO DOWNLOAD WORKFLOW (Enhanced)")
-        print("-" * 50)
+        print(_DASH50)
         
         try:
             # Step 1: Get URL
             print("\nStep 1: Video URL")
-            print("-" * 20)
+            print(_DASH20)
             url = self.get_input("Enter video URL (http:// or https://)")
             
-            if not videolib.FormatParser.is_valid_url(url):
+            # Cheap scheme check first; the full validator only runs on plausible URLs
+            if not url.startswith(('http://', 'https://')) or not videolib.FormatParser.is_valid_url(url):
                 print("X Invalid URL format. URL must start with http:// or https://")
                 return
             
             # Step 2: Get output filename  
             print("\nStep 2: Output Settings")
-            print("-" * 25)
+            print(_DASH25)
             
             # Suggest filename from URL and show truncated version
             suggested = videolib.FileManager.suggest_filename_from_url(url)
@@ -431,7 +783,7 @@ class InteractiveCLI:
             
             # Step 4: Confirm and execute
             print("\nStep 3: Confirmation")
-            print("-" * 20)
+            print(_DASH20)
             print(f"-> URL: {url}")  # Full URL in confirmation
             print(f"-> Output: {output_filename}")  # Full filename in confirmation
             print(f"-> Overwrite: {'Yes' if overwrite else 'No'}")
@@ -444,7 +796,7 @@ class InteractiveCLI:
             # Execute download with interrupt support
             print("\n-> Starting download with real-time monitoring...")
             print("-> Press 'q' anytime during download to cancel and return to menu")
-            print("-" * 50)
+            print(_DASH50)
             
             try:
                 # Start keyboard listener
@@ -500,43 +852,13 @@ class InteractiveCLI:
                 "-i", url,
                 "-c", "copy",  # stream copy for faster download
                 "-progress", "pipe:1",  # Enable progress output to stdout
-                "-loglevel", "info",    # Show info level logs
+                "-loglevel", "error",   # Progress records carry the stats
+                "-nostats",             # Drop the duplicate human status line
                 output_filename
             ]
             
             # Execute with real-time monitoring and interrupt support
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Combine stderr into stdout
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Monitor output in real-time with interrupt checking
-            while True:
-                # Check for 'q' interrupt
-                if self.keyboard_listener.should_quit:
-                    print("\n-> Terminating FFmpeg process...")
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)  # Wait up to 5 seconds for graceful termination
-                    except subprocess.TimeoutExpired:
-                        print("-> Force killing FFmpeg process...")
-                        process.kill()
-                    break
-                
-                # Read FFmpeg output
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    # Parse FFmpeg output for statistics
-                    self.ffmpeg_monitor.parse_ffmpeg_line(output.strip())
-            
-            # Get return code
-            return_code = process.poll()
+            return_code = asyncio.run(self._run_download_process(cmd))
             
             # Stop monitoring
             self.ffmpeg_monitor.stop_display()
@@ -548,52 +870,92 @@ class InteractiveCLI:
             # Check result
             if return_code == 0 and os.path.exists(output_filename):
                 file_size = os.path.getsize(output_filename)
-                return type('Result', (), {
-                    'success': True,
-                    'output_file': output_filename,
-                    'file_size': file_size,
-                    'error_message': None
-                })()
+                return DownloadResult(True, output_filename, file_size, None)
             else:
-                return type('Result', (), {
-                    'success': False,
-                    'output_file': output_filename,
-                    'file_size': None,
-                    'error_message': f"FFmpeg process failed with code {return_code}"
-                })()
+                return DownloadResult(
+                    False, output_filename, None,
+                    f"FFmpeg process failed with code {return_code}"
+                )
                 
         except Exception as e:
             self.ffmpeg_monitor.stop_display()
-            return type('Result', (), {
-                'success': False,
-                'output_file': output_filename,
-                'file_size': None,
-                'error_message': str(e)
-            })()
+            return DownloadResult(False, output_filename, None, str(e))
+    
+    async def _run_download_process(self, cmd: List[str]) -> int:
+        """Run FFmpeg, feeding its output to the monitor until it exits or 'q' is pressed"""
+        loop = asyncio.get_running_loop()
+        cancel = asyncio.Event()
+        listener = self.keyboard_listener
+        listener.on_quit = lambda: loop.call_soon_threadsafe(cancel.set)
+        if listener.should_quit:
+            cancel.set()  # Pressed before the callback was installed
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,  # Combine stderr into stdout
+            # The transport keeps draining the pipe into this buffer while we
+            # parse; only pause reading (and so block FFmpeg) past 2 MiB
+            limit=PIPE_BUFFER_LIMIT
+        )
+        cancelled = asyncio.ensure_future(cancel.wait())
+        # Decode each chunk in one pass and fold \r and \r\n line ends into \n
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('ascii')(errors='ignore'), translate=True
+        )
+        pending = ""
+        
+        try:
+            while True:
+                # Wake on whichever comes first: FFmpeg output or a 'q' press
+                read = asyncio.ensure_future(process.stdout.read(PIPE_READ_SIZE))
+                done, _ = await asyncio.wait(
+                    {read, cancelled}, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if cancelled in done:
+                    read.cancel()
+                    print("\n-> Terminating FFmpeg process...")
+                    process.terminate()
+                    try:
+                        # Wait up to 5 seconds for graceful termination
+                        return await asyncio.wait_for(process.wait(), timeout=5)
+                    except asyncio.TimeoutError:
+                        print("-> Force killing FFmpeg process...")
+                        process.kill()
+                        return await process.wait()
+                
+                chunk = read.result()
+                if not chunk:
+                    break  # EOF - FFmpeg has exited
+                *lines, pending = (pending + decoder.decode(chunk)).split('\n')
+                for line in lines:
+                    # Parse FFmpeg output for statistics
+                    if line:
+                        self.ffmpeg_monitor.parse_ffmpeg_line(line.strip())
+            
+            return await process.wait()
+        finally:
+            listener.on_quit = None
+            cancelled.cancel()
     
     def split_video_interactive(self):
         """Interactive split video workflow with 'q' interrupt support"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("VIDEO SPLIT WORKFLOW")
-        print("-" * 50)
+        print(_DASH50)
         
         try:
             # Step 1: Get source file
             print("\nStep 1: Source Video")
-            print("-" * 20)
+            print(_DASH20)
             source_file = self.get_file_path("Enter source video file path", must_exist=True)
 
             # Get media info with progress
             print("\n-> Analyzing video...")
             print("-> Press 'q' to cancel analysis")
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Analyzing video file...")
-            
-            try:
-                media_info = self.processor.get_media_info(source_file)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
+            with self._progress_and_keys("Analyzing video file..."):
+                media_info = cached_media_info(self.processor, source_file)
             
             # Check for user interrupt
             if self.keyboard_listener.should_quit:
@@ -612,7 +974,7 @@ class InteractiveCLI:
         
             # Step 2: Get target size
             print("\nStep 2: Target Size")
-            print("-" * 20)
+            print(_DASH20)
             target_size_str = self.get_input("Enter target size per segment (e.g. 500MB, 1GB)")
             
             # Parse target size
@@ -639,14 +1001,15 @@ class InteractiveCLI:
             
             # Step 3: Output settings
             print("\nStep 3: Output Settings")
-            print("-" * 25)
+            print(_DASH25)
             
             # Suggest output name from source file
-            suggested_name = os.path.splitext(os.path.basename(source_file))[0] + "_segment"
+            source_stem, source_ext = os.path.splitext(source_file)
+            suggested_name = os.path.basename(source_stem) + "_segment"
             output_name = self.get_input("Output name prefix (without extension)", suggested_name)
             
             # Get output extension (default to source extension)
-            suggested_ext = os.path.splitext(source_file)[1][1:] if os.path.splitext(source_file)[1] else "mp4"
+            suggested_ext = source_ext[1:] if source_ext else "mp4"
             output_extension = self.get_input("Output file extension", suggested_ext)
             
             # Normalize extension
@@ -654,7 +1017,7 @@ class InteractiveCLI:
             
             # Step 4: Advanced settings (optional)
             print("\nStep 4: Advanced Settings (Optional)")
-            print("-" * 35)
+            print(_DASH35)
             use_advanced = self.get_yes_no("Configure advanced settings?", False)
             
             if use_advanced:
@@ -683,7 +1046,7 @@ class InteractiveCLI:
             
             # Step 5: Confirmation
             print("\nStep 5: Confirmation")
-            print("-" * 20)
+            print(_DASH20)
             print(f"-> Source: {self.truncate_path(source_file)}")
             print(f"-> Target size: {videolib.FormatParser.format_file_size(target_size_bytes)}")
             print(f"-> Output prefix: {output_name}")
@@ -702,16 +1065,11 @@ class InteractiveCLI:
             # Step 6: Execute split with interrupt support
             print("\n-> Starting video split...")
             print("-> Press 'q' anytime during processing to cancel and return to menu")
-            print("-" * 50)
-            
-            # Start keyboard listener
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Splitting video...")
+            print(_DASH50)
             
-            try:
+            # Run with progress display and keyboard listener
+            with self._progress_and_keys("Splitting video..."):
                 # Use VideoSplitter from processor
-                from videolib.core.splitter import SplitOptions
-                
                 options = SplitOptions(
                     source_file=source_file,
                     output_name=output_name,
@@ -723,10 +1081,6 @@ class InteractiveCLI:
                 
                 # Execute split
                 result = self.processor.splitter.split_by_size(options)
-                
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
             
             # Check for user interrupt
             if self.keyboard_listener.should_quit:
@@ -735,9 +1089,9 @@ class InteractiveCLI:
                 return
             
             # Display results using the improved __str__ method
-            print("\n" + "=" * 50)
+            print("\n" + _EQ50)
             print("VIDEO SPLIT RESULTS")
-            print("=" * 50)
+            print(_EQ50)
             
             if result.success:
                 print(f"-> Successfully split video into {len(result.output_files)} segment(s)")
@@ -745,24 +1099,27 @@ class InteractiveCLI:
                 if result.was_copied:
                     print("-> Note: File was already smaller than target size and was copied")
                 
+                # Stat and format each file once; oversized files are also outputs
+                sizes = _collect_sizes(set(result.output_files) | set(result.oversized_files or []))
+                size_strs = {
+                    path: videolib.FormatParser.format_file_size(size)
+                    for path, size in sizes.items() if size
+                }
+                
                 # Show output files
                 print("\n-> Output segments:")
-                total_size = 0
+                total_size = sum(sizes[path] or 0 for path in result.output_files)
+                lines = []
                 for i, output_file in enumerate(result.output_files, 1):
-                    file_size = videolib.FileManager.get_file_size(output_file)
+                    name = os.path.basename(output_file)
+                    file_size = sizes[output_file]
                     if file_size:
-                        size_str = videolib.FormatParser.format_file_size(file_size)
-                        total_size += file_size
-                        
                         # Check if oversized
-                        if file_size > target_size_bytes:
-                            status = "[OVERSIZED]"
-                        else:
-                            status = ""
-                        
-                        print(f"   {i}. {os.path.basename(output_file)} ({size_str}) {status}")
+                        status = "[OVERSIZED]" if file_size > target_size_bytes else ""
+                        lines.append(f"   {i}. {name} ({size_strs[output_file]}) {status}")
                     else:
-                        print(f"   {i}. {os.path.basename(output_file)} (Size unknown)")
+                        lines.append(f"   {i}. {name} (Size unknown)")
+                self._emit_block(lines)
                 
                 # Show total size
                 if total_size > 0:
@@ -770,12 +1127,12 @@ class InteractiveCLI:
                 
                 # Show oversized files warning
                 if result.oversized_files:
-                    print(f"\n-> Warning: {len(result.oversized_files)} file(s) exceeded target size:")
+                    lines = [f"\n-> Warning: {len(result.oversized_files)} file(s) exceeded target size:"]
                     for oversized in result.oversized_files:
-                        file_size = videolib.FileManager.get_file_size(oversized)
-                        size_str = videolib.FormatParser.format_file_size(file_size) if file_size else "Unknown"
-                        print(f"   - {os.path.basename(oversized)} ({size_str})")
-                    print("-> Consider using a smaller target size or higher safety factor")
+                        size_str = size_strs.get(oversized, "Unknown")
+                        lines.append(f"   - {os.path.basename(oversized)} ({size_str})")
+                    lines.append("-> Consider using a smaller target size or higher safety factor")
+                    self._emit_block(lines)
             
             else:
                 print(f"X Split failed: {result.error_message}")
@@ -791,26 +1148,20 @@ class InteractiveCLI:
     
     def create_clips_interactive(self):
         """Interactive create clips workflow with 'q' interrupt support"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("VIDEO CLIP CREATION WORKFLOW")
-        print("-" * 50)
+        print(_DASH50)
 
         try:
             # Step 1: Get source file
             print("\nStep 1: Source Video")
-            print("-" * 20)
+            print(_DASH20)
             source_file = self.get_file_path("Enter source video file path", must_exist=True)
 
             # Get media info with progress
             print("\n-> Analyzing video...")
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Analyzing video file...")
-
-            try:
-                media_info = self.processor.get_media_info(source_file)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
+            with self._progress_and_keys("Analyzing video file..."):
+                media_info = cached_media_info(self.processor, source_file)
 
             if self.keyboard_listener.should_quit:
                 print("\n-> Analysis cancelled by user ('q' pressed)")
@@ -825,26 +1176,30 @@ class InteractiveCLI:
                     print(f"-> Video codec: {media_info.video_codec}")
                 if media_info.audio_codec:
                     print(f"-> Audio codec: {media_info.audio_codec}")
+            else:
+                duration = "Unknown"
+            video_duration_sec = media_info.duration if media_info else None
 
             # Step 2: Get output settings
             print("\nStep 2: Output Settings")
-            print("-" * 25)
+            print(_DASH25)
 
             # Output name (without extension)
-            suggested_name = os.path.splitext(os.path.basename(source_file))[0] + "_clip"
+            source_stem, source_ext = os.path.splitext(source_file)
+            suggested_name = os.path.basename(source_stem) + "_clip"
             output_name = self.get_input("Output name prefix (without extension)", suggested_name)
 
             # Output extension
-            suggested_ext = os.path.splitext(source_file)[1][1:] if os.path.splitext(source_file)[1] else "mp4"
+            suggested_ext = source_ext[1:] if source_ext else "mp4"
             output_extension = self.get_input("Output file extension", suggested_ext)
             output_extension = videolib.FormatParser.normalize_extension(output_extension)
 
             # Step 3: Get clip intervals
             print("\nStep 3: Clip Intervals")
-            print("-" * 25)
+            print(_DASH25)
             print("-> Enter time intervals for clips")
             print("-> Time format: HH:MM:SS, MM:SS, or seconds")
-            print(f"-> Video duration: {duration if media_info else 'Unknown'}")
+            print(f"-> Video duration: {duration}")
             print("-> Enter 'done' when finished adding intervals")
 
             intervals = []
@@ -862,34 +1217,25 @@ class InteractiveCLI:
                         continue
                     break
 
-                # Validate start time
-                start_valid, start_error = videolib.InputValidator.validate_timecode(start_time_str)
-                if not start_valid:
-                    print(f"X {start_error}")
+                # Validate and parse start time in one pass
+                start_seconds = parse_time_seconds(start_time_str)
+                if start_seconds is None:
+                    print(f"X {TIME_FORMAT_ERROR}")
                     continue
 
                 # Get end time
                 end_time_str = self.get_input(f"  End time")
 
-                # Validate end time
-                end_valid, end_error = videolib.InputValidator.validate_timecode(end_time_str)
-                if not end_valid:
-                    print(f"X {end_error}")
-                    continue
-
-                # Parse to seconds
-                start_seconds = videolib.FormatParser.parse_timecode(start_time_str)
-                end_seconds = videolib.FormatParser.parse_timecode(end_time_str)
-
-                # Validate interval
-                if start_seconds >= end_seconds:
-                    print("X Start time must be less than end time")
+                # Parse end time and validate the interval in one call
+                end_seconds, interval_error = parse_end_time(start_seconds, end_time_str)
+                if interval_error:
+                    print(f"X {interval_error}")
                     continue
 
                 # Check against video duration if available
-                if media_info and media_info.duration:
-                    if end_seconds > media_info.duration:
-                        print(f"X Warning: End time ({end_seconds}s) exceeds video duration ({media_info.duration}s)")
+                if video_duration_sec:
+                    if end_seconds > video_duration_sec:
+                        print(f"X Warning: End time ({end_seconds}s) exceeds video duration ({video_duration_sec}s)")
                         proceed = self.get_yes_no("Add this interval anyway?", False)
                         if not proceed:
                             continue
@@ -907,7 +1253,7 @@ class InteractiveCLI:
 
             # Step 4: Codec settings
             print("\nStep 4: Codec Settings")
-            print("-" * 25)
+            print(_DASH25)
             print("-> Default: 'copy' (fast, no re-encoding)")
             print("-> Use 'libx264' for H.264 re-encoding")
 
@@ -916,7 +1262,7 @@ class InteractiveCLI:
 
             # Step 5: Confirmation
             print("\nStep 5: Confirmation")
-            print("-" * 20)
+            print(_DASH20)
             print(f"-> Source: {self.truncate_path(source_file)}")
             print(f"-> Output prefix: {output_name}")
             print(f"-> Output extension: {output_extension}")
@@ -935,10 +1281,9 @@ class InteractiveCLI:
             # Step 6: Execute clip creation
             print("\n-> Starting clip creation...")
             print("-> Press 'q' anytime during processing to cancel and return to menu")
-            print("-" * 50)
+            print(_DASH50)
 
             # Create clips using VideoClipper
-            from videolib.core.clipper import VideoClipper, ClipOptions, ClipInterval
 
             # Convert intervals to ClipInterval objects
             clip_intervals = []
@@ -967,15 +1312,9 @@ class InteractiveCLI:
             )
 
             # Execute with interrupt support
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start(f"Creating {len(clip_intervals)} clips...")
-
-            try:
+            with self._progress_and_keys(f"Creating {len(clip_intervals)} clips..."):
                 # Use processor's clipper
                 result = self.processor.clipper.create_clips(options)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
 
             # Check for user interruption
             if self.keyboard_listener.should_quit:
@@ -984,25 +1323,28 @@ class InteractiveCLI:
                 return
 
             # Display results
-            print("\n" + "=" * 50)
+            print("\n" + _EQ50)
             print("CLIP CREATION RESULTS")
-            print("=" * 50)
+            print(_EQ50)
 
             if result.success:
                 print(f"-> Successfully created {len(result.output_files)} clips")
-                print("\n-> Output files:")
-                for i, output_file in enumerate(result.output_files):
-                    file_size = videolib.FileManager.get_file_size(output_file)
-                    size_str = videolib.FormatParser.format_file_size(file_size) if file_size else "Unknown"
-                    print(f"   {i+1}. {os.path.basename(output_file)} ({size_str})")
+                lines = ["\n-> Output files:"]
+                sizes = _collect_sizes(result.output_files)
+                format_size = videolib.FormatParser.format_file_size
+                for i, output_file in enumerate(result.output_files, 1):
+                    file_size = sizes[output_file]
+                    size_str = format_size(file_size) if file_size else "Unknown"
+                    lines.append(f"   {i}. {os.path.basename(output_file)} ({size_str})")
+                self._emit_block(lines)
             else:
                 print(f"X Clip creation failed: {result.error_message}")
 
             # Show failed clips if any
             if result.failed_clips:
-                print(f"\n-> Failed clips: {len(result.failed_clips)}")
-                for clip_num, error in result.failed_clips:
-                    print(f"   X Clip {clip_num}: {error}")
+                lines = [f"\n-> Failed clips: {len(result.failed_clips)}"]
+                lines.extend(f"   X Clip {clip_num}: {error}" for clip_num, error in result.failed_clips)
+                self._emit_block(lines)
 
         except KeyboardInterrupt:
             print("\n-> Clip creation cancelled by user")
@@ -1038,9 +1380,9 @@ class InteractiveCLI:
 
     def get_media_info_interactive(self):
         """Interactive media info workflow with 'q' interrupt support"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("MEDIA INFORMATION")
-        print("-" * 50)
+        print(_DASH50)
         
         try:
             # Get file path
@@ -1049,14 +1391,8 @@ class InteractiveCLI:
             print("\n-> Analyzing media file...")
             print("-> Press 'q' to cancel analysis")
             
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Reading media information...")
-            
-            try:
-                media_info = self.processor.get_media_info(file_path)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
+            with self._progress_and_keys("Reading media information..."):
+                media_info = cached_media_info(self.processor, file_path)
             
             if self.keyboard_listener.should_quit:
                 print("\n-> Analysis cancelled by user ('q' pressed)")
@@ -1066,9 +1402,9 @@ class InteractiveCLI:
                 print("X Could not get media information for this file")
                 return
             
-            print("\n" + "=" * 50)
+            print("\n" + _EQ50)
             print(f"Media Information: {Path(file_path).name}")
-            print("=" * 50)
+            print(_EQ50)
             
             if media_info.duration:
                 print(f"-> Duration: {videolib.FormatParser.format_duration(media_info.duration)}")
@@ -1101,11 +1437,29 @@ class InteractiveCLI:
         
         self.pause_for_user()
     
+    @staticmethod
+    def _load_and_validate_config(config_file: str):
+        """Validate and load a batch config file in one step
+        
+        Returns:
+            (config, errors) - config is None when validation failed
+        """
+        manager = videolib.ConfigurationManager()
+        load_and_validate = getattr(manager, 'load_and_validate', None)
+        if load_and_validate is not None:
+            # Single read + parse when the library provides it
+            return load_and_validate(config_file)
+        
+        is_valid, errors = manager.validate_config_file(config_file)
+        if not is_valid:
+            return None, errors
+        return videolib.load_config_from_file(config_file), []
+    
     def batch_process_interactive(self):
         """Interactive batch processing workflow with 'q' interrupt support"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("BATCH PROCESSING FROM CONFIG FILE")
-        print("-" * 50)
+        print(_DASH50)
         
         try:
             # Get config file
@@ -1115,21 +1469,14 @@ class InteractiveCLI:
             print("\n-> Validating configuration...")
             print("-> Press 'q' to cancel validation")
             
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Validating config file...")
-            
-            try:
-                manager = videolib.ConfigurationManager()
-                is_valid, errors = manager.validate_config_file(config_file)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
+            with self._progress_and_keys("Validating config file..."):
+                config, errors = self._load_and_validate_config(config_file)
             
             if self.keyboard_listener.should_quit:
                 print("\n-> Validation cancelled by user ('q' pressed)")
                 return
             
-            if not is_valid:
+            if config is None:
                 print("X Configuration validation failed:")
                 for error in errors:
                     print(f"   -> {error}")
@@ -1137,16 +1484,11 @@ class InteractiveCLI:
             
             print("-> Configuration is valid")
             
-            # Load config
-            config = videolib.load_config_from_file(config_file)
-            
             # Show config summary
             print("\n-> Configuration Summary:")
             print(f"-> Total tasks: {len(config.tasks)}")
             
-            task_counts = {}
-            for task in config.tasks:
-                task_counts[task.task_type] = task_counts.get(task.task_type, 0) + 1
+            task_counts = Counter(task.task_type for task in config.tasks)
             
             for task_type, count in task_counts.items():
                 print(f"   -> {task_type}: {count}")
@@ -1162,8 +1504,8 @@ class InteractiveCLI:
             
             # Convert config to task list for batch processing
             tasks = []
-            for task in config.tasks:
-                merged_params = config.get_merged_params(config.tasks.index(task))
+            for idx, task in enumerate(config.tasks):
+                merged_params = config.get_merged_params(idx)
                 tasks.append({
                     'type': task.task_type,
                     'parameters': merged_params
@@ -1173,38 +1515,42 @@ class InteractiveCLI:
             print("\n-> Starting batch processing...")
             print("-> Press 'q' anytime during processing to cancel and return to menu")
             
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Processing batch tasks...")
+            print("\n" + _EQ50)
+            print("BATCH PROCESSING RESULTS")
+            print(_EQ50)
+            print("-> Task Details:")
+            sys.stdout.flush()
             
+            # Independent tasks fan out to worker processes in their "order";
+            # each result is shown as soon as its task finishes
+            total_tasks = successful = 0
+            self.keyboard_listener.start_listening()
+            stream = CLICommands(self.processor).process_batch_stream(tasks)
             try:
-                result = self.processor.process_batch(tasks)
+                for task_result in stream:
+                    total_tasks += 1
+                    task_num = task_result['task_index'] + 1
+                    task_type = task_result['task_type']
+                    if task_succeeded(task_result):
+                        successful += 1
+                        print(f"   -> Task {task_num} ({task_type}): SUCCESS")
+                    else:
+                        print(f"   X Task {task_num} ({task_type}): FAILED")
+                    sys.stdout.flush()
+                    if self.keyboard_listener.should_quit:
+                        break
             finally:
-                self.progress_tracker.stop()
+                stream.close()  # Tasks already running finish before this returns
                 self.keyboard_listener.stop_listening()
             
             if self.keyboard_listener.should_quit:
                 print("\n-> Batch processing cancelled by user ('q' pressed)")
                 return
             
-            # Show results
-            print("\n" + "=" * 50)
-            print("BATCH PROCESSING RESULTS")
-            print("=" * 50)
-            print(f"-> Total tasks: {result['total_tasks']}")
-            print(f"-> Successful: {result['successful_tasks']}")
-            print(f"-> Failed: {result['failed_tasks']}")
-            print(f"-> Success rate: {result['success_rate']:.1f}%")
-            
-            # Show individual results
-            if result['results']:
-                print("\n-> Task Details:")
-                for task_result in result['results']:
-                    task_num = task_result['task_index'] + 1
-                    task_type = task_result['task_type']
-                    success = getattr(task_result['result'], 'success', task_result['result'].get('success', False))
-                    
-                    status_icon = "->" if success else "X"
-                    print(f"   {status_icon} Task {task_num} ({task_type}): {'SUCCESS' if success else 'FAILED'}")
+            print(f"\n-> Total tasks: {total_tasks}")
+            print(f"-> Successful: {successful}")
+            print(f"-> Failed: {total_tasks - successful}")
+            print(f"-> Success rate: {successful / total_tasks * 100 if total_tasks else 0:.1f}%")
             
         except KeyboardInterrupt:
             print("\n-> Batch processing cancelled by user")
@@ -1217,9 +1563,9 @@ class InteractiveCLI:
     
     def settings_menu(self):
         """Settings and configuration menu"""
-        print("\n" + "-" * 50)
+        print("\n" + _DASH50)
         print("SETTINGS")
-        print("-" * 50)
+        print(_DASH50)
         
         while True:
             print("\n-> Settings Menu:")
@@ -1233,13 +1579,9 @@ class InteractiveCLI:
                 
                 if choice == '0':
                     break
-                elif choice == '1':
-                    self.processor = None
-                    self.initialize_processor()
-                elif choice == '2':
-                    self.check_ffmpeg_version()
-                elif choice == '3':
-                    self.test_media_file()
+                action = self._settings_actions.get(choice)
+                if action is not None:
+                    action()
                 else:
                     print("X Invalid option. Please try again.")
                     
@@ -1247,22 +1589,67 @@ class InteractiveCLI:
                 print("\n-> Settings menu cancelled")
                 break
     
+    def _reinitialize_processor(self):
+        """Drop the current processor and cached tool info, then initialize again"""
+        self.processor = None
+        self._ffmpeg_version_cache.clear()
+        self.initialize_processor()
+    
+    def _quit(self):
+        """Leave the main loop"""
+        print("\n-> Thank you for using VideoLib!")
+        self.running = False
+    
+    def _invalid_menu_option(self):
+        """Handle an unknown main menu choice"""
+        print("X Invalid option. Please try again.")
+        self.pause_for_user("Press Enter to continue...")
+    
     def check_ffmpeg_version(self):
         """Check FFmpeg version"""
         print("\n-> Checking FFmpeg version...")
+        
+        # The same binary always reports the same version; skip the spawn
+        ffmpeg_path = shutil.which('ffmpeg')
+        cache_key = None
+        if ffmpeg_path:
+            try:
+                cache_key = (ffmpeg_path, os.stat(ffmpeg_path).st_mtime_ns)
+            except OSError:
+                pass
+        version_line = self._ffmpeg_version_cache.get(cache_key)
+        if version_line is not None:
+            print(f"-> {version_line}")
+            self.pause_for_user()
+            return
+        
+        sys.stdout.flush()  # Keep ordering with the child's output
         try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                # Get first line which contains version info
-                version_line = result.stdout.split('\n')[0]
+            process = subprocess.Popen(['ffmpeg', '-version'], stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL, text=True)
+            timed_out = []
+            watchdog = threading.Timer(10, lambda: (timed_out.append(True), process.kill()))
+            watchdog.start()
+            try:
+                # Only the first line holds the version; skip the build configuration
+                version_line = process.stdout.readline().rstrip()
+            finally:
+                watchdog.cancel()
+                process.stdout.close()
+                if process.poll() is None:
+                    process.terminate()
+                process.wait()
+            
+            if timed_out:
+                print("X FFmpeg version check timed out")
+            elif version_line.startswith('ffmpeg'):
+                if cache_key is not None:
+                    self._ffmpeg_version_cache[cache_key] = version_line
                 print(f"-> {version_line}")
             else:
                 print("X FFmpeg not found or not working")
         except FileNotFoundError:
             print("X FFmpeg executable not found in PATH")
-        except subprocess.TimeoutExpired:
-            print("X FFmpeg version check timed out")
         except Exception as e:
             print(f"X Error checking FFmpeg: {e}")
         
@@ -1277,14 +1664,8 @@ class InteractiveCLI:
             print("\n-> Testing file...")
             print("-> Press 'q' to cancel test")
             
-            self.keyboard_listener.start_listening()
-            self.progress_tracker.start("Testing media file...")
-            
-            try:
-                media_info = self.processor.get_media_info(file_path)
-            finally:
-                self.progress_tracker.stop()
-                self.keyboard_listener.stop_listening()
+            with self._progress_and_keys("Testing media file..."):
+                media_info = cached_media_info(self.processor, file_path)
             
             if self.keyboard_listener.should_quit:
                 print("\n-> Test cancelled by user ('q' pressed)")
@@ -1318,30 +1699,8 @@ class InteractiveCLI:
                 
                 try:
                     choice = self.get_input("Select option").strip()
+                    self._menu_actions.get(choice, self._invalid_menu_option)()
                     
-                    if choice == '0':
-                        print("\n-> Thank you for using VideoLib!")
-                        self.running = False
-                    elif choice == '1':
-                        self.download_video_interactive()
-                    elif choice == '2':
-                        self.split_video_interactive()
-                    elif choice == '3':
-                        self.create_clips_interactive()
-                    elif choice == '4':
-                        self.gif_commands.create_gif_clips_interactive()
-                    elif choice == '5':
-                        self.create_scale_encode_interactive()
-                    elif choice == '6':
-                        self.get_media_info_interactive()
-                    elif choice == '7':
-                        self.batch_process_interactive()
-                    elif choice == '8':
-                        self.settings_menu()
-                    else:
-                        print("X Invalid option. Please try again.")
-                        self.pause_for_user("Press Enter to continue...")
-                        
                 except KeyboardInterrupt:
                     print("\n\n-> Operation cancelled. Returning to main menu...")
                     continue
@@ -1354,9 +1713,11 @@ class InteractiveCLI:
         finally:
             # Final cleanup
             self.keyboard_listener.stop_listening()
+            sys.stdout.flush()
 
 def main():
     """Entry point for interactive CLI"""
+    configure_stdout_buffering()
     cli = InteractiveCLI()
     cli.run()
 
@@ -6,12 +6,18 @@ CLICommands class with specialized functionality for video scaling and
 audio encoding operations.
 """
 
+import hashlib
+import json
 import os
+import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Tuple
 
 import videolib
-from .commands import CLICommands
-from .ui import MenuHandler, InputHandler, DisplayHandler, UIHelper
+from .commands import CLICommands, prune_cache_dir
+from .ui import MenuHandler, InputHandler, DisplayHandler, UIHelper, _fast_input
 
 from videolib.config.scale_encode_presets import (
     RESOLUTION_PRESETS_DESKTOP, RESOLUTION_PRESETS_VR,
@@ -20,6 +26,94 @@ from videolib.config.scale_encode_presets import (
     AUDIO_CODEC_OPTIONS, SAMPLE_RATE_OPTIONS, CHANNEL_OPTIONS
 )
 
+
+def _to_int(value: str) -> Optional[int]:
+    """Parse a menu choice, returning None when it is not an integer"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _codec_menu_lines(options: Dict[str, Any], detected: str = None) -> List[str]:
+    """Numbered codec menu lines, marking codecs that contain detected"""
+    return [
+        f"  {i}. {codec}{' (detected)' if detected and detected in codec else ''} - {info['desc']}"
+        for i, (codec, info) in enumerate(options.items(), 1)
+    ]
+
+
+# Static menu bodies built once; each prompt only appends its detected/custom lines
+_CODEC_MENUS = {
+    codec_type: ("\n".join(_codec_menu_lines(options)), tuple(options))
+    for codec_type, options in (("video", VIDEO_CODEC_OPTIONS), ("audio", AUDIO_CODEC_OPTIONS))
+}
+_PROFILE_MENU = "\n".join(f"  {i}. {profile}" for i, profile in enumerate(VIDEO_PROFILE_OPTIONS, 1))
+_LEVEL_MENU = "\n".join(f"  {i}. {level}" for i, level in enumerate(VIDEO_LEVEL_OPTIONS, 1))
+_FRAME_RATE_MENU = "\n".join(f"  {i}. {fps}" for i, fps in enumerate(FRAME_RATE_OPTIONS, 1))
+_SAMPLE_RATE_MENU = "\n".join(f"  {i}. {sr} Hz" for i, sr in enumerate(SAMPLE_RATE_OPTIONS, 1))
+_CHANNEL_MENU = "\n".join(f"  {key}. {info['desc']}" for key, info in CHANNEL_OPTIONS.items())
+
+# Bitrate menus offer recommended/custom, plus copy when a bitrate was detected
+_BITRATE_PROMPTS = {n: f"\n> Select bitrate (1-{n}): " for n in (2, 3)}
+
+# Channel menu key -> (channels, layout) for the standard presets
+_CHANNEL_DISPATCH = {key: (info['channels'], info['layout']) for key, info in CHANNEL_OPTIONS.items()}
+
+# FFprobe results keyed by source file version, shared across runs; only the
+# most recently used PROBE_CACHE_MAX results are kept
+PROBE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "videolib_ffprobe")
+PROBE_CACHE_MAX = 64
+
+
+def _probe_cache_path(input_file: str) -> Optional[str]:
+    """Cache file for the current version (path, size, mtime) of input_file"""
+    try:
+        st = os.stat(input_file)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(input_file)}|{st.st_size}|{st.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(PROBE_CACHE_DIR, f"{digest}.json")
+
+
+def probe_cached(processor, input_file: str) -> Dict[str, Any]:
+    """detect_advance_media_properties, reusing the on-disk result for unchanged files"""
+    cache_file = _probe_cache_path(input_file)
+    if cache_file:
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                detected_props = json.load(f)
+            os.utime(cache_file)  # Mark as recently used for pruning
+            return detected_props
+        except (OSError, ValueError):
+            pass
+
+    detected_props = processor.detect_advance_media_properties(input_file)
+    if detected_props and cache_file:
+        try:
+            payload = json.dumps(detected_props)
+        except (TypeError, ValueError):
+            return detected_props
+        # Only cache results JSON gives back unchanged (no tuples, non-string
+        # keys or other types), so a hit matches a fresh probe exactly
+        if json.loads(payload) != detected_props:
+            return detected_props
+        partial_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(PROBE_CACHE_DIR, exist_ok=True)
+            with open(partial_file, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(partial_file, cache_file)  # Readers never see a partial file
+        except OSError:
+            try:
+                os.remove(partial_file)
+            except OSError:
+                pass
+        else:
+            prune_cache_dir(PROBE_CACHE_DIR, PROBE_CACHE_MAX, suffix=".json")
+    return detected_props
+
 class ScaleEncodeCommand(CLICommands):
     """
     Scale & Encode command - complete workflow with all messages.
@@ -28,8 +122,11 @@ class ScaleEncodeCommand(CLICommands):
     and leverage base command handling patterns.
     """
     
-    # Message constants - all user-facing text content
-    MESSAGES = {
+    # Separator line for the settings summary
+    _SEP = "=" * 60
+    
+    # Message constants - all user-facing text content (read-only)
+    MESSAGES = MappingProxyType({
         'workflow_title': 'SCALE & ENCODE WORKFLOW',
         'step_1a': 'Input File Selection',
         'step_1b': 'Video Settings',
@@ -57,7 +154,7 @@ class ScaleEncodeCommand(CLICommands):
         'success_output': 'Output file',
         'failed_complete': 'Scale & Encode did not complete',
         'cancelled_by_user': 'Encoding cancelled by user',
-    }
+    })
     
     def __init__(self, processor: videolib.VideoProcessor, keyboard_listener, progress_tracker):
         """
@@ -95,21 +192,32 @@ class ScaleEncodeCommand(CLICommands):
         Returns:
             True if successful, False otherwise
         """
+        messages = self.MESSAGES
+        
         try:
-            self.display.display_section(self.MESSAGES['workflow_title'])
+            self.display.display_section(messages['workflow_title'])
             
             # Step 1a: Get input file
             input_file = self._get_input_file()
             if not input_file:
-                self.display.display_error(self.MESSAGES['error_no_file'])
+                self.display.display_error(messages['error_no_file'])
                 return False
             
-            # Step 2: Detect properties
-            detected_props = self._detect_properties(input_file)
+            # Step 2: Start detecting properties; the resolution prompts do not
+            # need them, so FFprobe runs while the user answers those
+            probe_pool = ThreadPoolExecutor(max_workers=1)
+            probe_future = probe_pool.submit(probe_cached, self.processor, input_file)
+            try:
+                # Step 3: Collect video settings
+                default_br = self._collect_resolution()
+                detected_props = self._detect_properties(probe_future)
+            finally:
+                # Never block on FFprobe here, so 'q'/Ctrl-C return straight away;
+                # an abandoned probe finishes in the background
+                probe_future.cancel()
+                probe_pool.shutdown(wait=False)
             self._display_detected_properties(detected_props)
-            
-            # Step 3: Collect video settings
-            self._collect_video_settings(detected_props)
+            self._collect_video_settings(detected_props, default_br)
             
             # Step 4: Collect audio settings
             self._collect_audio_settings(detected_props)
@@ -120,23 +228,23 @@ class ScaleEncodeCommand(CLICommands):
             # Step 6: Get output file
             output_file = self._get_output_file()
             if not output_file:
-                self.display.display_error(self.MESSAGES['error_no_output'])
+                self.display.display_error(messages['error_no_output'])
                 return False
             
             # Step 7: Confirm and execute
-            if not self.input_handler.get_confirmation(self.MESSAGES['confirm_proceed']):
-                self.display.display_warning(self.MESSAGES['cancelled_by_user'])
+            if not self.input_handler.get_confirmation(messages['confirm_proceed']):
+                self.display.display_warning(messages['cancelled_by_user'])
                 return False
             
             # Execute encoding
             return self._execute_encoding(input_file, output_file)
             
         except KeyboardInterrupt:
-            self.display.display_warning(self.MESSAGES['error_interrupted'])
+            self.display.display_warning(messages['error_interrupted'])
             return False
         except Exception as e:
-            self.display.display_error(f"Error in workflow: {e.with_traceback.format_exc()}")
             import traceback
+            self.display.display_error(f"Error in workflow: {e}")
             traceback.print_exc()
             return False
     
@@ -160,29 +268,39 @@ class ScaleEncodeCommand(CLICommands):
             if not retry:
                 return None
     
-    def _detect_properties(self, input_file: str) -> Dict[str, Any]:
+    def _detect_properties(self, probe_future: Future) -> Dict[str, Any]:
         """
-        Detect input file properties using FFprobe.
+        Wait for the background FFprobe detection of the input file.
         
         Args:
-            input_file: Path to input video file
+            probe_future: Future returned by submitting probe_cached
         
         Returns:
             Dictionary with detected video and audio properties
         """
-        self.display.display_info("FFprobe analyzing video...")
+        if not probe_future.done():
+            self.display.display_info("FFprobe analyzing video...")
+            self._wait_for_probes([probe_future], "Detecting properties...")
+        
+        detected_props = probe_future.result()
+        return detected_props if detected_props else {'video': {}, 'audio': {}}
+    
+    def _wait_for_probes(self, futures: List[Future], message: str) -> None:
+        """Show progress until the probes finish; raises KeyboardInterrupt on 'q'"""
         self.keyboard_listener.start_listening()
-        self.progress_tracker.start("Detecting properties...")
+        self.progress_tracker.start(message)
         
         try:
-            detected_props = self.processor.detect_advance_media_properties(input_file)
-            return detected_props if detected_props else {'video': {}, 'audio': {}}
+            # Short waits keep 'q' responsive; the probes themselves cannot be interrupted
+            pending = set(futures)
+            while pending and not self.keyboard_listener.should_quit:
+                pending = wait(pending, timeout=0.1).not_done
         finally:
             self.progress_tracker.stop()
             self.keyboard_listener.stop_listening()
-            
-            if self.keyboard_listener.should_quit:
-                raise KeyboardInterrupt("User cancelled")
+        
+        if self.keyboard_listener.should_quit:
+            raise KeyboardInterrupt("User cancelled")
     
     def _display_detected_properties(self, properties: Dict[str, Any]) -> None:
         """
@@ -191,38 +309,33 @@ class ScaleEncodeCommand(CLICommands):
         Args:
             properties: Dictionary with detected properties
         """
-        print("\nCurrent Input Video Information:")
-        
         video = properties.get('video', {})
-        print(f"- Codec: {video.get('codec', 'unknown')}")
-        print(f"- Profile: {video.get('profile', 'unknown')}")
-        print(f"- Level: {video.get('level', 'unknown')}")
-        print(f"- Bitrate: {video.get('bitrate', 'unknown')}")
-        print(f"- Frame Rate: {video.get('frame_rate', 'unknown')} fps")
-        print(f"- Resolution: {video.get('width')}x{video.get('height')}")
-        
         audio = properties.get('audio', {})
-        print(f"\n- Audio Codec: {audio.get('codec', 'unknown')}")
-        print(f"- Sample Rate: {audio.get('sample_rate', 'unknown')} Hz")
-        print(f"- Channels: {audio.get('channels', 'unknown')}")
-        print(f"- Audio Bitrate: {audio.get('bitrate', 'unknown')}")
+        lines = [
+            "\nCurrent Input Video Information:",
+            f"- Codec: {video.get('codec', 'unknown')}",
+            f"- Profile: {video.get('profile', 'unknown')}",
+            f"- Level: {video.get('level', 'unknown')}",
+            f"- Bitrate: {video.get('bitrate', 'unknown')}",
+            f"- Frame Rate: {video.get('frame_rate', 'unknown')} fps",
+            f"- Resolution: {video.get('width')}x{video.get('height')}",
+            f"\n- Audio Codec: {audio.get('codec', 'unknown')}",
+            f"- Sample Rate: {audio.get('sample_rate', 'unknown')} Hz",
+            f"- Channels: {audio.get('channels', 'unknown')}",
+            f"- Audio Bitrate: {audio.get('bitrate', 'unknown')}",
+        ]
+        
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
-    def _collect_video_settings(self, detected_props: Dict[str, Any]) -> None:
+    def _collect_resolution(self) -> str:
         """
-        Collect video settings from user with optimization.
+        Collect resolution type and resolution from user.
         
-        Optimization: If user selects detected codec, automatically use "copy" 
-        to skip re-encoding and improve processing speed.
-        
-        Args:
-            detected_props: Dictionary with detected properties
+        Returns:
+            Recommended video bitrate for the selected resolution
         """
-        from videolib.config.scale_encode_presets import (
-            RESOLUTION_PRESETS_DESKTOP, RESOLUTION_PRESETS_VR,
-            VIDEO_CODEC_OPTIONS, VIDEO_PROFILE_OPTIONS,
-            VIDEO_LEVEL_OPTIONS, FRAME_RATE_OPTIONS
-        )
-        
         self.display.display_step(self.MESSAGES['step_1b'])
         
         # Resolution type
@@ -230,7 +343,7 @@ class ScaleEncodeCommand(CLICommands):
         print("  1. Desktop")
         print("  2. VR")
         
-        res_type = input("\n> Select type (1-2): ").strip()
+        res_type = _fast_input("\n> Select type (1-2): ").strip()
         self.config.scale_resolution_type = "vr" if res_type == "2" else "desktop"
         
         # Resolution
@@ -242,9 +355,23 @@ class ScaleEncodeCommand(CLICommands):
         
         self.config.scale_height = height
         self.video_setting.height = height
-
+        return default_br
+    
+    def _collect_video_settings(self, detected_props: Dict[str, Any], default_br: str) -> None:
+        """
+        Collect video codec settings from user with optimization.
+        
+        Optimization: If user selects detected codec, automatically use "copy" 
+        to skip re-encoding and improve processing speed.
+        
+        Args:
+            detected_props: Dictionary with detected properties
+            default_br: Recommended bitrate for the selected resolution
+        """
+        video = detected_props.get('video') or {}
+        
         # ========== OPTIMIZATION: Video Codec Selection ==========
-        detected_codec = detected_props.get('video', {}).get('codec')
+        detected_codec = video.get('codec')
         selected_codec_index = self._select_codec_index("video", detected_codec)
 
         # Determine actual codec to use
@@ -258,17 +385,17 @@ class ScaleEncodeCommand(CLICommands):
             print("\n[Optimized: Using codec 'copy' - no re-encoding, processing speed improved]")
             
             # Keep profile/level/fps/bitrate as defaults (won't be used with copy)
-            self.config.video_profile = detected_props.get('video', {}).get('profile', 'high')
-            #self.video_setting.profile = detected_props.get('video', {}).get('profile', 'high')
+            self.config.video_profile = video.get('profile', 'high')
+            #self.video_setting.profile = video.get('profile', 'high')
 
-            self.config.video_level = detected_props.get('video', {}).get('level', '4.1')
-            #self.video_setting.level = detected_props.get('video', {}).get('level', '4.1')
+            self.config.video_level = video.get('level', '4.1')
+            #self.video_setting.level = video.get('level', '4.1')
 
-            self.config.video_frame_rate = detected_props.get('video', {}).get('frame_rate', 30)
-            #self.video_setting.frame_rate = detected_props.get('video', {}).get('frame_rate', 30)
+            self.config.video_frame_rate = video.get('frame_rate', 30)
+            #self.video_setting.frame_rate = video.get('frame_rate', 30)
 
-            self.config.video_bitrate = detected_props.get('video', {}).get('bitrate', '5000k')
-            #self.video_setting.bitrate = detected_props.get('video', {}).get('bitrate', '5000k')
+            self.config.video_bitrate = video.get('bitrate', '5000k')
+            #self.video_setting.bitrate = video.get('bitrate', '5000k')
         
         else:
             # User selected custom codec → Full re-encoding with all settings
@@ -276,22 +403,22 @@ class ScaleEncodeCommand(CLICommands):
             self.video_setting.codec = selected_codec_index
             
             # Profile
-            detected_profile = detected_props.get('video', {}).get('profile')
+            detected_profile = video.get('profile')
             self.config.video_profile = self._select_profile(detected_profile)
             self.video_setting.profile = self.config.video_profile
             
             # Level
-            detected_level = detected_props.get('video', {}).get('level')
+            detected_level = video.get('level')
             self.config.video_level = self._select_level(detected_level)
             self.video_setting.level = self.config.video_level
             
             # Frame rate
-            detected_fps = detected_props.get('video', {}).get('frame_rate')
+            detected_fps = video.get('frame_rate')
             self.config.video_frame_rate = self._select_frame_rate(detected_fps)
             self.video_setting.frame_rate = self.config.video_frame_rate
             
             # Bitrate
-            detected_br = detected_props.get('video', {}).get('bitrate')
+            detected_br = video.get('bitrate')
             self.config.video_bitrate = self._select_video_bitrate(detected_br, default_br)
             self.video_setting.bitrate = self.config.video_bitrate
     
@@ -305,14 +432,12 @@ class ScaleEncodeCommand(CLICommands):
         Args:
             detected_props: Dictionary with detected properties
         """
-        from videolib.config.scale_encode_presets import (
-            SAMPLE_RATE_OPTIONS, CHANNEL_OPTIONS
-        )
-        
         self.display.display_step(self.MESSAGES['step_1c'])
         
+        audio = detected_props.get('audio') or {}
+        
         # ========== OPTIMIZATION: Audio Codec Selection ==========
-        detected_audio_codec = detected_props.get('audio', {}).get('codec')
+        detected_audio_codec = audio.get('codec')
         selected_audio_codec_index = self._select_codec_index("audio", detected_audio_codec)
         
         # Determine actual codec to use
@@ -325,11 +450,11 @@ class ScaleEncodeCommand(CLICommands):
             print("\n[Optimized: Using codec 'copy' - no re-encoding, processing speed improved]")
             
             # Keep audio settings as detected (won't be used with copy)
-            self.config.audio_profile = detected_props.get('audio', {}).get('profile', 'aac_low')
-            self.config.audio_sample_rate = int(detected_props.get('audio', {}).get('sample_rate', 44100))
-            self.config.audio_channels = int(detected_props.get('audio', {}).get('channels', 2))
-            self.config.audio_channel_layout = detected_props.get('audio', {}).get('channel_layout', 'stereo')
-            self.config.audio_bitrate = detected_props.get('audio', {}).get('bitrate', '192k')
+            self.config.audio_profile = audio.get('profile', 'aac_low')
+            self.config.audio_sample_rate = int(audio.get('sample_rate', 44100))
+            self.config.audio_channels = int(audio.get('channels', 2))
+            self.config.audio_channel_layout = audio.get('channel_layout', 'stereo')
+            self.config.audio_bitrate = audio.get('bitrate', '192k')
         
         else:
             # User selected custom codec → Full re-encoding with all settings
@@ -337,12 +462,12 @@ class ScaleEncodeCommand(CLICommands):
             self.audio_setting.codec = selected_audio_codec_index
             
             # Sample rate
-            detected_sr = detected_props.get('audio', {}).get('sample_rate')
+            detected_sr = audio.get('sample_rate')
             self.config.audio_sample_rate = self._select_sample_rate(detected_sr)
             self.audio_setting.audio_sample_rate = self.config.audio_sample_rate
             
             # Channels
-            detected_ch = detected_props.get('audio', {}).get('channels')
+            detected_ch = audio.get('channels')
             channels, layout = self._select_channels(detected_ch)
 
             self.config.audio_channels = channels
@@ -352,7 +477,7 @@ class ScaleEncodeCommand(CLICommands):
             self.audio_setting.channel_layout = layout
             
             # Audio bitrate
-            detected_abr = detected_props.get('audio', {}).get('bitrate')
+            detected_abr = audio.get('bitrate')
             self.config.audio_bitrate = self._select_audio_bitrate(detected_abr, channels)
             self.audio_setting.bitrate = self.config.audio_bitrate
 
@@ -376,37 +501,32 @@ class ScaleEncodeCommand(CLICommands):
             "detected" - User wants to use detected codec (will trigger "copy")
             codec_name - User selected specific codec
         """
-        from videolib.config.scale_encode_presets import (
-            VIDEO_CODEC_OPTIONS, AUDIO_CODEC_OPTIONS
-        )
-        
-        print(f"\n{self.MESSAGES['codec_select'].format(codec_type.title())}:")
-        
         options = VIDEO_CODEC_OPTIONS if codec_type == "video" else AUDIO_CODEC_OPTIONS
+        menu, codec_list = _CODEC_MENUS[codec_type]
         
-        # Display standard codec options (without old "copy" option)
-        for i, (codec, info) in enumerate(options.items(), 1):
-            marker = " (detected)" if detected and detected in codec else ""
-            print(f"  {i}. {codec}{marker} - {info['desc']}")
+        # Standard codec options (without old "copy" option); only rebuilt
+        # when one of them needs the (detected) marker
+        if detected and any(detected in codec for codec in codec_list):
+            menu = "\n".join(_codec_menu_lines(options, detected))
+        lines = [f"\n{self.MESSAGES['codec_select'].format(codec_type.title())}:", menu]
         
         # Add optimized "Keep detected" option if we have a detected codec
+        next_option = len(options) + 1
         if detected:
-            next_option = len(options) + 1
-            print(f"  {next_option}. Keep detected ({detected}) - Optimized (copy, faster) ⚡")
-            print(f"  {next_option + 1}. Custom")
+            lines.append(f"  {next_option}. Keep detected ({detected}) - Optimized (copy, faster) ⚡")
+            lines.append(f"  {next_option + 1}. Custom")
             max_choices = len(options) + 2
         else:
-            next_option = len(options) + 1
-            print(f"  {next_option}. Custom")
+            lines.append(f"  {next_option}. Custom")
             max_choices = len(options) + 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         # Get user selection
         choice = self.menu.get_selection("Select codec", max_choices, allow_custom=True)
         
-        codec_list = list(options.keys())
-        
-        if choice.isdigit():
-            choice_int = int(choice)
+        choice_int = _to_int(choice)
+        if choice_int is not None:
             
             # ========== USER SELECTED "KEEP DETECTED" ==========
             # This triggers the optimization path (codec="copy")
@@ -416,7 +536,7 @@ class ScaleEncodeCommand(CLICommands):
             # ========== USER SELECTED "CUSTOM" ==========
             custom_option = len(options) + 2 if detected else len(options) + 1
             if choice_int == custom_option:
-                custom_codec = self.input_handler.get_string("Enter custom codec", required=True)
+                custom_codec = self._get_custom_name("Enter custom codec")
                 return custom_codec
             
             # ========== USER SELECTED STANDARD CODEC ==========
@@ -430,25 +550,30 @@ class ScaleEncodeCommand(CLICommands):
     
     def _display_settings_summary(self) -> None:
         """Display complete configuration summary"""
-        print("\n" + "=" * 60)
-        print("VIDEO SETTINGS")
-        print("=" * 60)
-        print(f"Resolution: {self.config.scale_width}x{self.config.scale_height}")
-        print(f"Codec: {self.config.video_codec}")
-        print(f"Profile: {self.config.video_profile}")
-        print(f"Level: {self.config.video_level}")
-        print(f"Frame Rate: {self.config.video_frame_rate} fps")
-        print(f"Bitrate: {self.config.video_bitrate}")
-        
-        print("\n" + "=" * 60)
-        print("AUDIO SETTINGS")
-        print("=" * 60)
-        print(f"Codec: {self.config.audio_codec}")
-        print(f"Profile: {self.config.audio_profile}")
-        print(f"Sample Rate: {self.config.audio_sample_rate} Hz")
-        print(f"Channels: {self.config.audio_channels} ({self.config.audio_channel_layout})")
-        print(f"Bitrate: {self.config.audio_bitrate}")
-        print("=" * 60)
+        sep = self._SEP
+        lines = [
+            "\n" + sep,
+            "VIDEO SETTINGS",
+            sep,
+            f"Resolution: {self.config.scale_width}x{self.config.scale_height}",
+            f"Codec: {self.config.video_codec}",
+            f"Profile: {self.config.video_profile}",
+            f"Level: {self.config.video_level}",
+            f"Frame Rate: {self.config.video_frame_rate} fps",
+            f"Bitrate: {self.config.video_bitrate}",
+            "\n" + sep,
+            "AUDIO SETTINGS",
+            sep,
+            f"Codec: {self.config.audio_codec}",
+            f"Profile: {self.config.audio_profile}",
+            f"Sample Rate: {self.config.audio_sample_rate} Hz",
+            f"Channels: {self.config.audio_channels} ({self.config.audio_channel_layout})",
+            f"Bitrate: {self.config.audio_bitrate}",
+            sep,
+        ]
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def _get_output_file(self) -> Optional[str]:
         """
@@ -461,7 +586,11 @@ class ScaleEncodeCommand(CLICommands):
         
         output_file = self.input_handler.get_string("Enter output file name", default="video_scaled.mp4")
         
-        if os.path.exists(output_file):
+        try:
+            os.stat(output_file)
+        except OSError:
+            pass  # Nothing to overwrite
+        else:
             overwrite = self.input_handler.get_confirmation(f"File '{output_file}' exists. Overwrite", default=False)
             if not overwrite:
                 return None
@@ -506,6 +635,11 @@ class ScaleEncodeCommand(CLICommands):
     
     # ========== Menu Selection Helper Methods ==========
     
+    def _get_custom_name(self, prompt: str) -> Optional[str]:
+        """Custom codec/profile/level name, interned like the preset names it is compared with"""
+        value = self.input_handler.get_string(prompt, required=True)
+        return sys.intern(value) if value else value
+    
     def _select_resolution(self, res_type: str) -> Tuple[int, int, str]:
         """Get resolution selection from user"""
         
@@ -520,8 +654,9 @@ class ScaleEncodeCommand(CLICommands):
         choice = self.menu.get_selection("Select resolution", len(presets), allow_custom=True)
         
         preset_list = list(presets.items())
-        if choice.isdigit() and 1 <= int(choice) <= len(preset_list):
-            name, specs = preset_list[int(choice) - 1]
+        choice_int = _to_int(choice)
+        if choice_int is not None and 1 <= choice_int <= len(preset_list):
+            name, specs = preset_list[choice_int - 1]
             return (specs['width'], specs['height'], specs['default_bitrate'])
         elif choice == str(len(presets) + 1):
             width = self.input_handler.get_integer("Enter width", min_val=64, max_val=16384)
@@ -531,49 +666,26 @@ class ScaleEncodeCommand(CLICommands):
         
         return (1920, 1080, "6000k")
     
-    def _select_codec(self, codec_type: str, detected: str = None) -> str:
-        """
-        Get codec selection from user (backward compatible).
-        
-        Note: For optimized collection, use _select_codec_index instead.
-        
-        Args:
-            codec_type: 'video' or 'audio'
-            detected: Detected codec name
-        
-        Returns:
-            Selected codec name
-        """
-        selected = self._select_codec_index(codec_type, detected)
-        
-        # If optimization selected, return the detected codec
-        # (actual "copy" will be set in _collect_video_settings/_collect_audio_settings)
-        if selected == "detected":
-            return detected or ("libx264" if codec_type == "video" else "aac")
-        
-        return selected
-    
     def _select_profile(self, detected: str = None) -> str:
         """Get profile selection from user"""
-        print(f"\n{self.MESSAGES['profile_select']}:")
-        
-        for i, profile in enumerate(VIDEO_PROFILE_OPTIONS, 1):
-            print(f"  {i}. {profile}")
+        lines = [f"\n{self.MESSAGES['profile_select']}:", _PROFILE_MENU]
         
         # Add "copy" option with detected value
         copy_option = len(VIDEO_PROFILE_OPTIONS) + 1
         if detected:
-            print(f"  {copy_option}. copy ({detected})")
-            print(f"  {copy_option + 1}. Custom")
+            lines.append(f"  {copy_option}. copy ({detected})")
+            lines.append(f"  {copy_option + 1}. Custom")
             max_choice = len(VIDEO_PROFILE_OPTIONS) + 2
         else:
-            print(f"  {copy_option}. Custom")
+            lines.append(f"  {copy_option}. Custom")
             max_choice = len(VIDEO_PROFILE_OPTIONS) + 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         choice = self.menu.get_selection("Select profile", max_choice, allow_custom=True)
         
-        if choice.isdigit():
-            choice_int = int(choice)
+        choice_int = _to_int(choice)
+        if choice_int is not None:
             
             # User selected "copy"
             if detected and choice_int == copy_option:
@@ -585,32 +697,31 @@ class ScaleEncodeCommand(CLICommands):
             
             # User selected custom
             if (detected and choice_int == copy_option + 1) or (not detected and choice_int == copy_option):
-                return self.input_handler.get_string("Enter custom profile", required=True)
+                return self._get_custom_name("Enter custom profile")
         
         return "high"
 
     
     def _select_level(self, detected: str = None) -> str:
         """Get level selection from user"""
-        print(f"\n{self.MESSAGES['level_select']}:")
-        
-        for i, level in enumerate(VIDEO_LEVEL_OPTIONS, 1):
-            print(f"  {i}. {level}")
+        lines = [f"\n{self.MESSAGES['level_select']}:", _LEVEL_MENU]
         
         # Add "copy" option with detected value
         copy_option = len(VIDEO_LEVEL_OPTIONS) + 1
         if detected:
-            print(f"  {copy_option}. copy ({detected})")
-            print(f"  {copy_option + 1}. Custom")
+            lines.append(f"  {copy_option}. copy ({detected})")
+            lines.append(f"  {copy_option + 1}. Custom")
             max_choice = len(VIDEO_LEVEL_OPTIONS) + 2
         else:
-            print(f"  {copy_option}. Custom")
+            lines.append(f"  {copy_option}. Custom")
             max_choice = len(VIDEO_LEVEL_OPTIONS) + 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         choice = self.menu.get_selection("Select level", max_choice, allow_custom=True)
         
-        if choice.isdigit():
-            choice_int = int(choice)
+        choice_int = _to_int(choice)
+        if choice_int is not None:
             
             # User selected "copy"
             if detected and choice_int == copy_option:
@@ -622,31 +733,30 @@ class ScaleEncodeCommand(CLICommands):
             
             # User selected custom
             if (detected and choice_int == copy_option + 1) or (not detected and choice_int == copy_option):
-                return self.input_handler.get_string("Enter custom level", required=True)
+                return self._get_custom_name("Enter custom level")
         
         return "4.1"
 
     def _select_frame_rate(self, detected: float = None) -> int:
         """Get frame rate selection from user"""
-        print(f"\n{self.MESSAGES['frame_rate_select']}:")
-        
-        for i, fps in enumerate(FRAME_RATE_OPTIONS, 1):
-            print(f"  {i}. {fps}")
+        lines = [f"\n{self.MESSAGES['frame_rate_select']}:", _FRAME_RATE_MENU]
         
         # Add "copy" option with detected value
         copy_option = len(FRAME_RATE_OPTIONS) + 1
         if detected:
-            print(f"  {copy_option}. copy ({detected})")
-            print(f"  {copy_option + 1}. Custom")
+            lines.append(f"  {copy_option}. copy ({detected})")
+            lines.append(f"  {copy_option + 1}. Custom")
             max_choice = len(FRAME_RATE_OPTIONS) + 2
         else:
-            print(f"  {copy_option}. Custom")
+            lines.append(f"  {copy_option}. Custom")
             max_choice = len(FRAME_RATE_OPTIONS) + 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         choice = self.menu.get_selection("Select frame rate", max_choice, allow_custom=True)
         
-        if choice.isdigit():
-            choice_int = int(choice)
+        choice_int = _to_int(choice)
+        if choice_int is not None:
             
             # User selected "copy"
             if detected and choice_int == copy_option:
@@ -664,31 +774,30 @@ class ScaleEncodeCommand(CLICommands):
     
     def _select_channels(self, detected: int = None) -> Tuple[int, str]:
         """Get channel selection from user"""
-        print(f"\n{self.MESSAGES['channels_select']}:")
-        
-        for key, info in CHANNEL_OPTIONS.items():
-            print(f"  {key}. {info['desc']}")
+        lines = [f"\n{self.MESSAGES['channels_select']}:", _CHANNEL_MENU]
         
         # Add "copy" option with detected value
         if detected:
-            print(f"  5. copy ({detected} channels)")
-            print("  6. Custom")
+            lines.append(f"  5. copy ({detected} channels)")
+            lines.append("  6. Custom")
             max_choice = "6"
         else:
-            print("  5. Custom")
+            lines.append("  5. Custom")
             max_choice = "5"
         
-        choice = input(f"\n> Select channels (1-{max_choice}): ").strip()
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        choice = _fast_input(f"\n> Select channels (1-{max_choice}): ").strip()
+        
+        # User selected standard option
+        preset = _CHANNEL_DISPATCH.get(choice)
+        if preset:
+            return preset
         
         # User selected "copy"
         if detected and choice == "5":
             return (detected, "copy")
         
-        # User selected standard option
-        if choice in CHANNEL_OPTIONS:
-            cfg = CHANNEL_OPTIONS[choice]
-            return (cfg['channels'], cfg['layout'])
-        
         # User selected custom
         custom_option = "6" if detected else "5"
         if choice == custom_option:
@@ -700,20 +809,19 @@ class ScaleEncodeCommand(CLICommands):
     
     def _select_video_bitrate(self, detected: str = None, recommended: str = None) -> str:
         """Get video bitrate selection from user"""
-        print(f"\n{self.MESSAGES['video_bitrate_select']}:")
-        
-        print(f"  1. Use recommended bitrate ({recommended})")
+        lines = [f"\n{self.MESSAGES['video_bitrate_select']}:", f"  1. Use recommended bitrate ({recommended})"]
         
         # Add "copy" option with detected value
         if detected:
-            print(f"  2. copy ({detected})")
-            print("  3. Custom")
+            lines.append(f"  2. copy ({detected})")
+            lines.append("  3. Custom")
             max_choice = 3
         else:
-            print("  2. Custom")
+            lines.append("  2. Custom")
             max_choice = 2
         
-        choice = input(f"\n> Select bitrate (1-{max_choice}): ").strip()
+        sys.stdout.write("\n".join(lines) + "\n")
+        choice = _fast_input(_BITRATE_PROMPTS[max_choice]).strip()
         
         if choice == "1":
             return recommended or "5000k"
@@ -737,26 +845,24 @@ class ScaleEncodeCommand(CLICommands):
         Returns:
             Sample rate value or "copy" string
         """
-        print(f"\n{self.MESSAGES['sample_rate_select']}:")
-        
-        # Display sample rate options WITHOUT (detected) marker
-        for i, sr in enumerate(SAMPLE_RATE_OPTIONS, 1):
-            print(f"  {i}. {sr} Hz")
+        lines = [f"\n{self.MESSAGES['sample_rate_select']}:", _SAMPLE_RATE_MENU]
         
         # Add "copy" option with detected value
         copy_option = len(SAMPLE_RATE_OPTIONS) + 1
         if detected:
-            print(f"  {copy_option}. copy ({detected} Hz)")
-            print(f"  {copy_option + 1}. Custom")
+            lines.append(f"  {copy_option}. copy ({detected} Hz)")
+            lines.append(f"  {copy_option + 1}. Custom")
             max_choice = len(SAMPLE_RATE_OPTIONS) + 2
         else:
-            print(f"  {copy_option}. Custom")
+            lines.append(f"  {copy_option}. Custom")
             max_choice = len(SAMPLE_RATE_OPTIONS) + 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         choice = self.menu.get_selection("Select sample rate", max_choice, allow_custom=True)
         
-        if choice.isdigit():
-            choice_int = int(choice)
+        choice_int = _to_int(choice)
+        if choice_int is not None:
             
             # User selected "copy"
             if detected and choice_int == copy_option:
@@ -777,20 +883,19 @@ class ScaleEncodeCommand(CLICommands):
         """Get audio bitrate selection from user"""
         default_abr = "192k" if channels == 2 else ("96k" if channels == 1 else "384k")
         
-        print(f"\n{self.MESSAGES['audio_bitrate_select']}:")
-        
-        print(f"  1. Use recommended bitrate ({default_abr})")
+        lines = [f"\n{self.MESSAGES['audio_bitrate_select']}:", f"  1. Use recommended bitrate ({default_abr})"]
         
         # Add "copy" option with detected value
         if detected:
-            print(f"  2. copy ({detected})")
-            print("  3. Custom")
+            lines.append(f"  2. copy ({detected})")
+            lines.append("  3. Custom")
             max_choice = 3
         else:
-            print("  2. Custom")
+            lines.append("  2. Custom")
             max_choice = 2
         
-        choice = input(f"\n> Select bitrate (1-{max_choice}): ").strip()
+        sys.stdout.write("\n".join(lines) + "\n")
+        choice = _fast_input(_BITRATE_PROMPTS[max_choice]).strip()
         
         if choice == "1":
             return default_abr
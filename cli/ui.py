@@ -2,10 +2,73 @@
 UI utilities for CLI
 """
 
+import atexit
 import sys
 import os
+import re
 import time
-from typing import Optional, List, Dict
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple, Union
+
+# Imported only for its side effect: once loaded, input() on a TTY gets line
+# editing and history. This is the one place the CLI loads it for that
+# (not available on Windows)
+try:
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
+# [[HH:]MM:]SS[.fff] - with one colon group it is MM:SS, with two HH:MM:SS
+_TIME_RE = re.compile(r"^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d+)?)$")
+TIME_FORMAT_ERROR = "Invalid time format. Use HH:MM:SS, MM:SS, or seconds"
+
+# Erase the rest of a progress line: ANSI on terminals, spaces elsewhere
+_CLEAR_EOL = "\x1b[K"
+_CLEAR_PAD = " " * 50
+
+# Yes/no prompt suffixes and the answers that count as yes
+_SUFFIX_DEFAULT_YES = "[Y/n]"
+_SUFFIX_DEFAULT_NO = "[y/N]"
+_YES_RESPONSES = frozenset({'y', 'yes', '1', 'true'})
+
+# File size units, 1024 apart
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+
+@lru_cache(maxsize=2048)
+def _format_duration(seconds: float) -> str:
+    """Format duration in seconds to human-readable format (cached; durations repeat a lot)"""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    elif seconds < 3600:
+        minutes = int(seconds // 60)
+        secs = int(seconds % 60)
+        return f"{minutes:02d}:{secs:02d}"
+    else:
+        hours = int(seconds // 3600)
+        minutes = int((seconds % 3600) // 60)
+        secs = int(seconds % 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def _fast_input(prompt: str) -> str:
+    """input() on a TTY (keeps line editing); a plain write and readline on piped stdin"""
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
+
+
+def configure_stdout_buffering() -> None:
+    """Block-buffer stdout when it is piped or redirected; terminals keep line buffering"""
+    if not sys.stdout.isatty() and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        atexit.register(sys.stdout.flush)
+
 
 class CLIFormatter:
     """CLI output formatting utilities"""
@@ -13,35 +76,47 @@ class CLIFormatter:
     @staticmethod
     def success(message: str) -> None:
         """Print success message"""
-        print(f"✅ {message}")
+        sys.stdout.write(f"✅ {message}\n")
     
     @staticmethod
     def error(message: str) -> None:
         """Print error message"""
-        print(f"❌ {message}", file=sys.stderr)
+        sys.stderr.write(f"❌ {message}\n")
     
     @staticmethod
     def warning(message: str) -> None:
         """Print warning message"""
-        print(f"⚠️ {message}")
+        sys.stdout.write(f"⚠️ {message}\n")
     
     @staticmethod
     def info(message: str) -> None:
         """Print info message"""
-        print(f"ℹ️ {message}")
+        sys.stdout.write(f"ℹ️ {message}\n")
     
     @staticmethod
     def progress(message: str) -> None:
         """Print progress message"""
-        print(f"⏳ {message}")
+        sys.stdout.write(f"⏳ {message}\n")
 
 class ProgressReporter:
     """Simple progress reporter for CLI"""
+
+    # Minimum seconds between redraws (10 Hz)
+    MIN_REDRAW_INTERVAL = 0.1
+    
+    # Padded 20-slot bar for every 5% step
+    _BARS = tuple(("█" * i).ljust(20) for i in range(21))
+    
+    # Status line: bar, percent, optional " - message"
+    _STATUS_TEMPLATE = "\r[%s] %.1f%%%s"
     
     def __init__(self, show_progress: bool = True):
         self.show_progress = show_progress
         self.current_step = 0
         self.total_steps = 0
+        self._last_draw = 0.0
+        self._last_shown = None  # (whole percent, message) of the last redraw
+        self._ansi = sys.stdout.isatty()
     
     def start(self, total_steps: int, message: str = "") -> None:
         """Start progress reporting"""
@@ -50,6 +125,8 @@ class ProgressReporter:
         
         self.total_steps = total_steps
         self.current_step = 0
+        self._last_draw = 0.0
+        self._last_shown = None
         
         if message:
             print(f"🚀 {message}")
@@ -63,22 +140,39 @@ class ProgressReporter:
             self.current_step = step
         else:
             self.current_step += 1
-        
+
         progress_percent = (self.current_step / self.total_steps) * 100 if self.total_steps > 0 else 0
-        progress_bar = "█" * int(progress_percent // 5)
-        status = f"[{progress_bar:<20}] {progress_percent:.1f}%"
         
-        if message:
-            status += f" - {message}"
+        # Nothing visible changes until the whole percent or the message does
+        shown = (int(progress_percent), message)
+        if shown == self._last_shown:
+            return
+        
+        # Throttle redraws; the final step is always drawn
+        now = time.monotonic()
+        if now - self._last_draw < self.MIN_REDRAW_INTERVAL and self.current_step < self.total_steps:
+            return
+        self._last_draw = now
+        self._last_shown = shown
         
-        print(f"\r{status}", end="", flush=True)
+        progress_bar = self._BARS[min(max(int(progress_percent) // 5, 0), 20)]
+        suffix = " - " + message if message else ""
+        
+        # One write per redraw; the flush is needed for the \r line to show, and
+        # redraws are already throttled above
+        sys.stdout.write(self._STATUS_TEMPLATE % (progress_bar, progress_percent, suffix))
+        sys.stdout.flush()
     
     def finish(self, message: str = "Completed") -> None:
         """Finish progress reporting"""
         if not self.show_progress:
             return
         
-        print(f"\r✅ {message}" + " " * 50)  # Clear any remaining progress bar
+        # Clear any remaining progress bar
+        if self._ansi:
+            sys.stdout.write(f"\r✅ {message}{_CLEAR_EOL}\n")
+        else:
+            sys.stdout.write(f"\r✅ {message}{_CLEAR_PAD}\n")
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -98,12 +192,19 @@ class Colors:
         """Apply color to text"""
         return f"{color}{text}{cls.END}"
 
+# Prebuilt ANSI pieces for section headers and step headers
+_HEADER_PREFIX = Colors.BOLD + Colors.CYAN
+_STEP_ARROW = Colors.colorize('→', Colors.BLUE)
+_RESET = Colors.END
+
 class UIHelper:
     """Enhanced UI helper that combines existing functionality with additional methods"""
     
     def __init__(self):
         self.formatter = CLIFormatter()
         self.progress = ProgressReporter()
+        # Piped or redirected output gets plain headers without escape codes
+        self._ansi = sys.stdout.isatty()
     
     # Method delegation to maintain compatibility
     def print_success(self, message: str) -> None:
@@ -130,14 +231,16 @@ class UIHelper:
     def print_header(self, title: str) -> None:
         """Print section header with formatting"""
         divider = "=" * len(title)
-        print(f"\n{divider}")
-        print(Colors.colorize(title.upper(), Colors.BOLD + Colors.CYAN))
-        print(divider)
+        heading = f"{_HEADER_PREFIX}{title.upper()}{_RESET}" if self._ansi else title.upper()
+        sys.stdout.write(f"\n{divider}\n{heading}\n{divider}\n")
     
     def print_step(self, step_text: str) -> None:
         """Print step header"""
-        print(f"\n{Colors.colorize('→', Colors.BLUE)} {Colors.colorize(step_text, Colors.BOLD)}")
-        print("-" * len(step_text))
+        if self._ansi:
+            heading = f"{_STEP_ARROW} {Colors.BOLD}{step_text}{_RESET}"
+        else:
+            heading = f"→ {step_text}"
+        sys.stdout.write(f"\n{heading}\n{'-' * len(step_text)}\n")
     
     def print_divider(self, char: str = "-", length: int = 50) -> None:
         """Print a divider line"""
@@ -145,117 +248,119 @@ class UIHelper:
     
     def confirm_action(self, message: str, default: bool = True) -> bool:
         """Ask for user confirmation"""
-        suffix = "[Y/n]" if default else "[y/N]"
-        response = input(f"? {message} {suffix}: ").strip().lower()
+        suffix = _SUFFIX_DEFAULT_YES if default else _SUFFIX_DEFAULT_NO
+        response = _fast_input(f"? {message} {suffix}: ").strip().casefold()
         
         if not response:
             return default
         
-        return response in ['y', 'yes', '1', 'true']
+        return response in _YES_RESPONSES
     
     def get_input(self, prompt: str, default: Optional[str] = None) -> str:
         """Get user input with optional default"""
         if default:
-            response = input(f"> {prompt} [{default}]: ").strip()
+            response = _fast_input(f"> {prompt} [{default}]: ").strip()
             return response if response else default
         else:
-            return input(f"> {prompt}: ").strip()
+            return _fast_input(f"> {prompt}: ").strip()
     
     def wait_for_enter(self, message: str = "Press Enter to continue...") -> None:
         """Wait for user to press Enter"""
-        input(f"\n-> {message}")
+        _fast_input(f"\n-> {message}")
     
     def format_duration(self, seconds: float) -> str:
         """Format duration in seconds to human-readable format"""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes:02d}:{secs:02d}"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _format_duration(seconds)
     
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in bytes to human-readable format"""
         if size_bytes == 0:
             return "0 B"
         
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        size_index = 0
         size = float(size_bytes)
         
-        while size >= 1024.0 and size_index < len(size_names) - 1:
-            size /= 1024.0
-            size_index += 1
-        
-        return f"{size:.1f} {size_names[size_index]}"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly;
+        # anything under 1 KB (fractions and negatives included) stays in bytes
+        size_index = min((int(size).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1) if size >= 1024 else 0
+        return f"{size / (1 << (size_index * 10)):.1f} {_SIZE_NAMES[size_index]}"
     
-    def get_file_size(self, file_path: str) -> int:
-        """Get file size in bytes"""
+    def get_file_size(self, file_path: Union[str, os.stat_result]) -> int:
+        """Get file size in bytes from a path or an already-obtained stat result (0 if missing)"""
+        if isinstance(file_path, os.stat_result):
+            return file_path.st_size
         try:
-            return os.path.getsize(file_path)
-        except (OSError, FileNotFoundError):
+            return os.stat(file_path).st_size
+        except OSError:
             return 0
     
     def parse_time_input(self, time_str: str) -> float:
         """Parse time input string to seconds"""
-        time_str = time_str.strip()
+        seconds = parse_time_seconds(time_str)
+        if seconds is not None:
+            return seconds
         
-        # Try to parse as plain seconds first
+        # Off the regex fast path: plain float() input (e.g. negative seconds the
+        # caller range-checks) and the original error messages
+        time_str = time_str.strip()
         try:
             return float(time_str)
         except ValueError:
             pass
-        
-        # Parse HH:MM:SS or MM:SS format
-        parts = time_str.split(':')
-        
-        if len(parts) == 2:  # MM:SS
-            try:
-                minutes = int(parts[0])
-                seconds = float(parts[1])
-                return minutes * 60 + seconds
-            except ValueError:
-                raise ValueError("Invalid time format")
-        
-        elif len(parts) == 3:  # HH:MM:SS
-            try:
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = float(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-            except ValueError:
-                raise ValueError("Invalid time format")
-        
-        else:
-            raise ValueError("Invalid time format. Use HH:MM:SS, MM:SS, or seconds")
+        if time_str.count(':') in (1, 2):
+            raise ValueError("Invalid time format")
+        raise ValueError(TIME_FORMAT_ERROR)
+
+def parse_time_seconds(time_str: str) -> Optional[float]:
+    """Parse HH:MM:SS, MM:SS or seconds to seconds in one regex pass; None if invalid"""
+    match = _TIME_RE.match(time_str.strip())
+    if not match:
+        return None
+
+    first, second, seconds = match.groups()
+    if second is not None:  # HH:MM:SS
+        return int(first) * 3600 + int(second) * 60 + float(seconds)
+    if first is not None:  # MM:SS
+        return int(first) * 60 + float(seconds)
+    return float(seconds)
+
+def parse_end_time(start_seconds: float, end_str: str) -> Tuple[Optional[float], Optional[str]]:
+    """Parse an interval end time and check it follows the start
+
+    Returns:
+        (end seconds, None) on success, (None, error message) otherwise
+    """
+    end_seconds = parse_time_seconds(end_str)
+    if end_seconds is None:
+        return None, TIME_FORMAT_ERROR
+    if start_seconds >= end_seconds:
+        return None, "Start time must be less than end time"
+    return end_seconds, None
 
 def confirm(message: str, default: bool = False) -> bool:
     """Ask for user confirmation - standalone function for backward compatibility"""
-    suffix = "[Y/n]" if default else "[y/N]"
-    response = input(f"{message} {suffix}: ").strip().lower()
+    suffix = _SUFFIX_DEFAULT_YES if default else _SUFFIX_DEFAULT_NO
+    response = _fast_input(f"{message} {suffix}: ").strip().casefold()
     
     if not response:
         return default
     
-    return response in ['y', 'yes', '1', 'true']
+    return response in _YES_RESPONSES
 
 def get_input(prompt: str, default: Optional[str] = None) -> str:
     """Get user input with optional default - standalone function for backward compatibility"""
     if default:
-        response = input(f"{prompt} [{default}]: ").strip()
+        response = _fast_input(f"{prompt} [{default}]: ").strip()
         return response if response else default
     else:
-        return input(f"{prompt}: ").strip()
+        return _fast_input(f"{prompt}: ").strip()
     
 # ============================================================================
 # Scale & Encode UI Components (Add to end of ui.py)
 # ============================================================================
 
+# Shared UIHelper for handlers constructed without one
+_DEFAULT_UI = UIHelper()
+
 class MenuHandler:
     """Reusable menu selection handler for CLI"""
     
@@ -266,7 +371,7 @@ class MenuHandler:
         Args:
             ui_helper: Optional UIHelper instance
         """
-        self.ui_helper = ui_helper or UIHelper()
+        self.ui_helper = ui_helper or _DEFAULT_UI
     
     def display_options(self, options: List[str], title: str = None) -> None:
         """
@@ -294,21 +399,18 @@ class MenuHandler:
         Returns:
             User selection as string
         """
+        highest = max_option + 1 if allow_custom else max_option
         while True:
             try:
-                choice = input(f"\n> {prompt}: ").strip()
-                
-                if choice.isdigit():
-                    if 1 <= int(choice) <= max_option:
-                        return choice
-                    elif allow_custom and int(choice) == max_option + 1:
-                        return choice
-                
-                print(f"X Invalid selection. Please enter 1-{max_option}")
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                print(f"X Error: {e}")
+                choice = _fast_input(f"\n> {prompt}: ").strip()
+            except EOFError:
+                # No more input will come; cancel instead of re-prompting forever
+                raise KeyboardInterrupt("Input closed")
+            
+            if choice.isdecimal() and 1 <= int(choice) <= highest:
+                return choice
+            
+            print(f"X Invalid selection. Please enter 1-{max_option}")
 
 
 class InputHandler:
@@ -321,7 +423,7 @@ class InputHandler:
         Args:
             ui_helper: Optional UIHelper instance
         """
-        self.ui_helper = ui_helper or UIHelper()
+        self.ui_helper = ui_helper or _DEFAULT_UI
     
     def get_file_path(self, prompt: str = "Enter file path", must_exist: bool = True) -> Optional[str]:
         """
@@ -336,7 +438,7 @@ class InputHandler:
         """
         while True:
             try:
-                file_path = input(f"> {prompt}: ").strip()
+                file_path = _fast_input(f"> {prompt}: ").strip()
                 
                 if not file_path:
                     print("X File path cannot be empty")
@@ -344,7 +446,7 @@ class InputHandler:
                 
                 if must_exist and not os.path.exists(file_path):
                     print(f"X File not found: {file_path}")
-                    retry = input("? Try again? [Y/n]: ").strip().lower()
+                    retry = _fast_input("? Try again? [Y/n]: ").strip().lower()
                     if retry != 'n':
                         continue
                     return None
@@ -369,7 +471,7 @@ class InputHandler:
         """
         while True:
             try:
-                value = int(input(f"> {prompt}: ").strip())
+                value = int(_fast_input(f"> {prompt}: ").strip())
                 
                 if min_val is not None and value < min_val:
                     print(f"X Value must be >= {min_val}")
@@ -401,11 +503,11 @@ class InputHandler:
         """
         try:
             if default:
-                response = input(f"> {prompt} [{default}]: ").strip()
+                response = _fast_input(f"> {prompt} [{default}]: ").strip()
                 return response if response else default
             else:
                 while True:
-                    response = input(f"> {prompt}: ").strip()
+                    response = _fast_input(f"> {prompt}: ").strip()
                     if response or not required:
                         return response
                     print("X Input cannot be empty")
@@ -425,13 +527,13 @@ class InputHandler:
         Returns:
             True for yes, False for no
         """
-        suffix = "[Y/n]" if default else "[y/N]"
-        response = input(f"? {prompt} {suffix}: ").strip().lower()
+        suffix = _SUFFIX_DEFAULT_YES if default else _SUFFIX_DEFAULT_NO
+        response = _fast_input(f"? {prompt} {suffix}: ").strip().casefold()
         
         if not response:
             return default
         
-        return response in ['y', 'yes', '1', 'true']
+        return response in _YES_RESPONSES
 
 
 class DisplayHandler:
@@ -444,7 +546,7 @@ class DisplayHandler:
         Args:
             ui_helper: Optional UIHelper instance
         """
-        self.ui_helper = ui_helper or UIHelper()
+        self.ui_helper = ui_helper or _DEFAULT_UI
     
     def display_section(self, title: str) -> None:
         """Display section header"""
@@ -7,112 +7,137 @@ Provides interactive menu and batch processing capabilities.
 """
 import sys
 import os
-from pathlib import Path
+import shutil
+from enum import IntEnum
+from importlib.util import find_spec
+
+# Launcher location, resolved once for the checks and sys.path setup
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+_PARENT_DIR = os.path.dirname(_MODULE_DIR)
+
+# Startup banner, written in one call
+_BANNER = (
+    "╔" + "=" * 64 + "╗\n"
+    "║                      VIDEOLIB PROCESSOR                        ║\n"
+    "║              Interactive Video Processing Tool                 ║\n"
+    "╚" + "=" * 64 + "╝\n"
+)
+
+class ReqStatus(IntEnum):
+    """Result of check_requirements"""
+    OK = 0
+    MISSING_FILES = 1
+    MISSING_VIDEOLIB = 2
+
+# Required files grouped by directory, so each directory is listed only once
+REQUIRED_FILES = {
+    ".": ("main.py",),
+    "cli": ("__init__.py", "interactive_main.py", "commands.py", "ui.py"),
+}
 
 def check_ffmpeg():
     """Check if FFmpeg is available"""
-    try:
-        import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            return True
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    # A PATH lookup is enough here; the version is probed later by the CLI
+    if shutil.which('ffmpeg'):
+        return True
     
     print("X FFmpeg not found in System PATH")
     print("Please install FFmpeg from: https://ffmpeg.org/download.html")
     print("Or specify custom paths in the application settings")
     return False
 
-def check_current_files_integrity():
+def list_directory(path) -> dict:
+    """Map entry names to os.DirEntry for one directory listing (empty if unreadable)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def check_current_files_integrity(root_entries: dict = None):
     """Check all required files are present in the current directory"""
-    required_files = [
-        "main.py", 
-        "cli/__init__.py", 
-        "cli/interactive_main.py", 
-        "cli/commands.py",
-        "cli/ui.py"
-    ]
-    current_dir = Path(__file__).parent
-    for file in required_files:
-        if not (current_dir / file).exists():
+    # Imported as part of an installed package: the installer laid out the files
+    if __package__:
+        return True
+    
+    for subdir, names in REQUIRED_FILES.items():
+        if subdir == "." and root_entries is not None:
+            entries = root_entries
+        else:
+            entries = list_directory(os.path.join(_MODULE_DIR, subdir))
+        # is_file() uses the directory entry type, so no extra stat
+        if not all(name in entries and entries[name].is_file() for name in names):
             return False
     return True
 
 def check_videolib_environment():
     """Check if VideoLib library is installed in the environment"""
+    # Locate the package without executing videolib/__init__.py
     try:
-        import videolib
-        return True
-    except ImportError:
+        return find_spec("videolib") is not None
+    except (ImportError, ValueError):
         return False
 
 def path_exists(path: str) -> bool:
     """Check if a given path exists"""
-    return Path(path).exists()
+    return os.access(path, os.F_OK)
 
 def check_requirements():
     """Check if VideoLib library is installed"""
 
-    # Get current directory
-    current_dir = Path(__file__).parent
-    
-    # Check for videolib package
-    videolib_path = current_dir / "videolib"
+    # One listing of the launcher directory answers both the main.py and the
+    # local videolib package checks
+    root_entries = list_directory(_MODULE_DIR)
 
     # Check for CLI module
-    if not check_current_files_integrity():
-        return 1
+    if not check_current_files_integrity(root_entries):
+        return ReqStatus.MISSING_FILES
     
-    if not path_exists(videolib_path) and not check_videolib_environment():
-        return 2
+    # Check for videolib package
+    if "videolib" not in root_entries and not check_videolib_environment():
+        return ReqStatus.MISSING_VIDEOLIB
     else:
-        return 0
+        return ReqStatus.OK
         
 
 # Validation and Import CLI modules
 def main():
     """Main entry point for VideoLib CLI"""
-    print("╔" + "=" * 64 + "╗")
-    print("║                      VIDEOLIB PROCESSOR                        ║")
-    print("║              Interactive Video Processing Tool                 ║")
-    print("╚" + "=" * 64 + "╝")
+    sys.stdout.write(_BANNER)
     
     # Check FFmpeg (warning only)
     ffmpeg_available = check_ffmpeg()
     if not ffmpeg_available:
         print("\nContinuing anyway - you can configure FFmpeg paths later...")
-        input("Press Enter to continue...")
+        # Only pause for a person at a terminal; piped/CI runs would block here
+        if sys.stdin.isatty():
+            input("Press Enter to continue...")
     
     # Check VideoLib library (fatal)
-    if check_requirements() == 1:
+    status = check_requirements()
+    if status == ReqStatus.MISSING_FILES:
         print("X FileIntegrityError: Missing required CLI files")
         print("Please ensure all files are present")
         print("More info: https://github.com/BrianAtCode/videolib-cli.git")
         sys.exit(1)
-    elif check_requirements() == 2:
+    elif status == ReqStatus.MISSING_VIDEOLIB:
         print("X ModuleNotFoundError: No module named 'videolib'")
         print("Please install VideoLib from: https://github.com/BrianAtCode/videolib.git")
         sys.exit(1)
         
     # Add parent directory to path for local development (sibling videolib repo)
-    parent_dir = Path(__file__).parent.parent
-    if parent_dir.exists():
-        p = str(parent_dir)
-        if p not in sys.path:
-            sys.path.insert(0, p)
-
-    # Ensure project root (so 'cli' package is importable when running main.py)
-    current_dir = Path(__file__).parent
-    proj = str(current_dir)
-    if proj not in sys.path:
-        sys.path.insert(0, proj)
+    if _PARENT_DIR not in sys.path and os.path.isdir(_PARENT_DIR):
+        sys.path.insert(0, _PARENT_DIR)
+
+    # Project root goes first (even if already listed), so the local 'cli'
+    # package is never shadowed by one in the parent directory
+    if _MODULE_DIR in sys.path:
+        sys.path.remove(_MODULE_DIR)
+    sys.path.insert(0, _MODULE_DIR)
     
     try:
-        from cli.interactive_main import InteractiveCLI
-        cli = InteractiveCLI()
-        cli.run()
+        from cli.interactive_main import main as interactive_main
+        interactive_main()
     except ImportError as e:
         print(f"\nX Import error: {e}")
         print("Make sure the VideoLib package is properly installed")
@@ -120,7 +145,7 @@ def main():
     except KeyboardInterrupt:
         print("\n\n-> Goodbye!")
     except Exception as e:
-        print(f"\n! Unexpected error: {e.with_traceback.format_exc()}")
+        print(f"\n! Unexpected error: {e}")
         print("Please report this issue")
         sys.exit(1)
 
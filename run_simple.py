@@ -4,14 +4,18 @@ Simple CLI runner for VideoLib - launches the interactive interface
 """
 import sys
 import os
-from pathlib import Path
+
+# Launcher location, resolved once for the sys.path setup
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+_PARENT_DIR = os.path.dirname(_MODULE_DIR)
 
 def main():
     """Main entry point - launches interactive CLI"""
     # Add current directory to Python path for importing
-    current_dir = Path(__file__).parent
-    sys.path.insert(0, str(current_dir))
-    sys.path.insert(0, str(current_dir.parent))
+    search_path = set(sys.path)
+    for path in (_MODULE_DIR, _PARENT_DIR):
+        if path not in search_path:
+            sys.path.insert(0, path)
     
     try:
         # Import and run the interactive CLI
@@ -0,0 +1,32 @@
+"""Tests for cli.commands helpers"""
+
+import os
+import tempfile
+import unittest
+
+from cli.commands import prune_cache_dir
+
+
+class PruneCacheDirTest(unittest.TestCase):
+    """prune_cache_dir keeps the most recently used matching files"""
+
+    def test_keeps_newest_matching_files(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for i in range(5):
+                path = os.path.join(cache_dir, f"{i}.json")
+                open(path, "w").close()
+                os.utime(path, (i, i))
+            other = os.path.join(cache_dir, "notes.txt")
+            open(other, "w").close()
+            os.utime(other, (0, 0))
+
+            prune_cache_dir(cache_dir, 2, suffix=".json")
+
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["3.json", "4.json", "notes.txt"])
+
+    def test_missing_directory(self):
+        prune_cache_dir(os.path.join(tempfile.gettempdir(), "videolib_no_such_cache"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
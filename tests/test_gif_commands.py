@@ -0,0 +1,91 @@
+"""Tests for the CLI-side GIF merge helpers in cli.gif_commands"""
+
+import os
+import struct
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from cli.gif_commands import GifCommands, gifs_stream_copyable, read_gif_screen
+from cli.ui import UIHelper
+
+
+def _write_gif(path, width, height, palette=b"\x00\x00\x00\xff\xff\xff"):
+    """Write a GIF header with a two-color global palette (enough for the screen checks)"""
+    with open(path, "wb") as f:
+        f.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0x80, 0, 0) + palette + b";")
+
+
+class GifMergeTest(unittest.TestCase):
+    """Stream-copy detection and the -c copy merge branch"""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _clips(self, *sizes, palettes=None):
+        paths = []
+        for i, (width, height) in enumerate(sizes):
+            path = os.path.join(self.temp_dir, f"clip_{i}.gif")
+            if palettes:
+                _write_gif(path, width, height, palettes[i])
+            else:
+                _write_gif(path, width, height)
+            paths.append(path)
+        return paths
+
+    def test_read_gif_screen(self):
+        clip, = self._clips((320, 180))
+        self.assertEqual(read_gif_screen(clip), (320, 180, b"\x00\x00\x00\xff\xff\xff"))
+        self.assertIsNone(read_gif_screen(os.path.join(self.temp_dir, "missing.gif")))
+
+    def test_stream_copyable(self):
+        clips = self._clips((854, 480), (854, 480))
+        self.assertTrue(gifs_stream_copyable(clips, 854, 480))
+        self.assertTrue(gifs_stream_copyable(clips, 854, 0))
+        self.assertTrue(gifs_stream_copyable(clips, 1000, 480))  # Already fits the box height
+        self.assertFalse(gifs_stream_copyable(clips, 1280, 720))
+
+    def test_not_copyable_with_mixed_clips(self):
+        self.assertFalse(gifs_stream_copyable(self._clips((854, 480), (640, 360)), 854, 480))
+        palettes = (b"\x00\x00\x00\xff\xff\xff", b"\x00\x00\x00\x10\x10\x10")
+        self.assertFalse(gifs_stream_copyable(self._clips((854, 480), (854, 480), palettes=palettes), 854, 480))
+
+    def _merge_command(self, clips, final_width, final_height):
+        commands = GifCommands.__new__(GifCommands)  # Skip the VideoProcessor setup
+        commands.processor = SimpleNamespace(ffmpeg=SimpleNamespace(ffmpeg_path="ffmpeg"))
+        captured = []
+        commands._run_ffmpeg_with_progress = lambda cmd: (captured.append(cmd), (0, ""))[1]
+        merged_file = os.path.join(self.temp_dir, "out_merged.gif")
+        self.assertIsNone(commands._merge_gif_files(clips, merged_file, final_width, final_height))
+        return captured[0]
+
+    def test_merge_stream_copies_matching_clips(self):
+        cmd = self._merge_command(self._clips((854, 480), (854, 480)), 854, 480)
+        self.assertIn("-c", cmd)
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+        self.assertNotIn("-filter_complex", cmd)
+
+    def test_merge_reencodes_other_sizes(self):
+        cmd = self._merge_command(self._clips((320, 180), (320, 180)), 1280, 720)
+        self.assertNotIn("-c", cmd)
+        self.assertIn("-filter_complex", cmd)
+
+
+class FormatDurationFromStrTest(unittest.TestCase):
+    """_format_duration_from_str accepts anything float() does and passes the rest through"""
+
+    def test_values(self):
+        commands = GifCommands.__new__(GifCommands)  # Skip the VideoProcessor setup
+        commands.ui = UIHelper()
+        for value, expected in (("12", "12.0s"), (" 90.5 ", "01:30"), ("1.5e1", "15.0s"),
+                                ("-0", "-0.0s"), (3725, "01:02:05"), ("N/A", "N/A"), (None, None)):
+            with self.subTest(value=value):
+                self.assertEqual(commands._format_duration_from_str(value), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for cli.ui formatting and parsing helpers"""
+
+import unittest
+
+from cli.ui import UIHelper
+
+
+class FormatFileSizeTest(unittest.TestCase):
+    """UIHelper.format_file_size unit selection and input coercion"""
+
+    CASES = (
+        (0, "0 B"),
+        (0.5, "0.5 B"),
+        (1, "1.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536.0, "1.5 KB"),
+        ("2048", "2.0 KB"),
+        (5 * 1024 ** 3, "5.0 GB"),
+        (2048 * 1024 ** 4, "2048.0 TB"),
+    )
+
+    def test_format_file_size(self):
+        ui = UIHelper()
+        for size_bytes, expected in self.CASES:
+            with self.subTest(size_bytes=size_bytes):
+                self.assertEqual(ui.format_file_size(size_bytes), expected)
+
+
+class ParseTimeInputTest(unittest.TestCase):
+    """UIHelper.parse_time_input formats and error messages"""
+
+    def test_valid_formats(self):
+        ui = UIHelper()
+        for text, expected in (("10", 10.0), (" 1:30 ", 90.0), ("1:02:03.5", 3723.5), ("-5", -5.0)):
+            with self.subTest(text=text):
+                self.assertEqual(ui.parse_time_input(text), expected)
+
+    def test_error_messages(self):
+        ui = UIHelper()
+        for text, message in (("1:xx", "Invalid time format"),
+                              ("abc", "Invalid time format. Use HH:MM:SS, MM:SS, or seconds"),
+                              ("1:2:3:4", "Invalid time format. Use HH:MM:SS, MM:SS, or seconds")):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError) as ctx:
+                    ui.parse_time_input(text)
+                self.assertEqual(str(ctx.exception), message)
+
+
+if __name__ == "__main__":
+    unittest.main()